@@ -8,8 +8,12 @@ including all foundation gates, seven protocol steps, epistemic fencing,
 red team review, drift detection, tone validation, and structured logging.
 
 Usage:
-    python pbhp_cli.py              Launch interactive menu
-    python pbhp_cli.py --help       Show help information
+    python pbhp_cli.py                  Launch interactive menu
+    python pbhp_cli.py --journal FILE   Also append completed assessments
+                                        to FILE (JSONL)
+    python pbhp_cli.py --editor         Answer multi-question steps in
+                                        $VISUAL / $EDITOR as one form
+    python pbhp_cli.py --help           Show help information
 
 No external dependencies required.
 
@@ -18,48 +22,97 @@ Contact: pausebeforeharmprotocol_pbhp@protonmail.com
 
 import sys
 import os
-import json
-from datetime import datetime
-from typing import List, Optional
+import atexit
+import time
+from functools import lru_cache
+from itertools import groupby
+from typing import TYPE_CHECKING
 
 # ---------------------------------------------------------------------------
-# Import from core module
+# Import from core module (deferred)
 # ---------------------------------------------------------------------------
-
-from pbhp_core import (
+#
+# pbhp_core is imported on first use rather than at module load so that
+# `--help` returns without paying for the engine's import cost.
+# _load_core() binds the names below as module globals. Every flow or
+# step that uses them calls it first, and attribute access from outside
+# the module (e.g. `pbhp_cli.PBHPEngine`) triggers it via __getattr__.
+
+_CORE_NAMES = (
     # Enumerations
-    ImpactLevel,
-    LikelihoodLevel,
-    RiskClass,
-    DecisionOutcome,
-    Mode,
-    UncertaintyLevel,
-    Confidence,
+    "ImpactLevel",
+    "LikelihoodLevel",
+    "RiskClass",
+    "DecisionOutcome",
+    "Mode",
+    "UncertaintyLevel",
+    "Confidence",
     # Data classes
-    Harm,
-    DoorWallGap,
-    ConstraintAwarenessCheck,
-    EthicalPausePosture,
-    QuickRiskCheck,
-    AbsoluteRejectionCheck,
-    ConsentCheck,
-    ConsequencesChecklist,
-    EpistemicFence,
-    RedTeamReview,
-    Alternative,
-    UncertaintyAssessment,
-    PBHPLog,
+    "Harm",
+    "DoorWallGap",
+    "ConstraintAwarenessCheck",
+    "EthicalPausePosture",
+    "QuickRiskCheck",
+    "AbsoluteRejectionCheck",
+    "ConsentCheck",
+    "ConsequencesChecklist",
+    "EpistemicFence",
+    "RedTeamReview",
+    "Alternative",
+    "UncertaintyAssessment",
+    "PBHPLog",
     # Engine and detectors
-    PBHPEngine,
-    DriftAlarmDetector,
-    ToneValidator,
-    LexicographicPriority,
+    "PBHPEngine",
+    "DriftAlarmDetector",
+    "ToneValidator",
+    "LexicographicPriority",
     # Convenience functions
-    quick_harm_check,
-    detect_drift_alarms,
-    compare_options,
+    "quick_harm_check",
+    "detect_drift_alarms",
+    "compare_options",
+    "mentions_safer_alternative",
+    "pretty_json",
 )
 
+if TYPE_CHECKING:
+    # Same names as _CORE_NAMES, visible to linters and type checkers only
+    from pbhp_core import (
+        ImpactLevel, LikelihoodLevel, RiskClass, DecisionOutcome, Mode,
+        UncertaintyLevel, Confidence,
+        Harm, DoorWallGap, ConstraintAwarenessCheck, EthicalPausePosture,
+        QuickRiskCheck, AbsoluteRejectionCheck, ConsentCheck,
+        ConsequencesChecklist, EpistemicFence, RedTeamReview, Alternative,
+        UncertaintyAssessment, PBHPLog,
+        PBHPEngine, DriftAlarmDetector, ToneValidator, LexicographicPriority,
+        quick_harm_check, detect_drift_alarms, compare_options,
+        mentions_safer_alternative, pretty_json,
+    )
+
+_core = None
+
+# Editor command for prompt_form(), set by --editor (None = ask inline)
+_form_editor = None
+
+
+def _load_core():
+    """Import pbhp_core and bind its public names into this module."""
+    global _core
+    if _core is None:
+        import pbhp_core
+        g = globals()
+        for name in _CORE_NAMES:
+            g[name] = getattr(pbhp_core, name)
+        _core = pbhp_core
+    return _core
+
+
+def __getattr__(name):
+    if name in _CORE_NAMES:
+        _load_core()
+        return globals()[name]
+    raise AttributeError("module " + repr(__name__) + " has no attribute " + repr(name))
+
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -68,58 +121,166 @@ VERSION = "0.9.5"
 CONTACT_EMAIL = "pausebeforeharmprotocol_pbhp@protonmail.com"
 BANNER_WIDTH = 72
 
+# Risk class display strings, keyed by RiskClass value so they can be
+# built without importing pbhp_core
+_RISK_LABELS = {
+    "green":  "GREEN  - Low risk, proceed normally",
+    "yellow": "YELLOW - Moderate risk, document and monitor",
+    "orange": "ORANGE - High risk, alternatives + red team required",
+    "red":    "RED    - Very high risk, must justify why alternatives fail",
+    "black":  "BLACK  - Extreme risk, refuse or escalate only",
+}
+_RISK_COLORS = {v: sys.intern(v.upper()) for v in _RISK_LABELS}
+
+# Separator bars for banner()/sub_banner()
+_BAR_EQ = "=" * BANNER_WIDTH
+_BAR_DASH = "-" * BANNER_WIDTH
+_BARS = {"=": _BAR_EQ, "-": _BAR_DASH}
+
+# Message prefixes for info()/warn()/error()/success()/drift_alarm()
+_P_INFO = "  [INFO] "
+_P_WARN = "  [WARN] "
+_P_ERROR = "  [ERROR] "
+_P_SUCCESS = "  [OK] "
+_P_DRIFT_ALARM = "  [DRIFT ALARM] "
+
+# Step 3 requirement lines per risk class, pre-rendered as one info block
+_RISK_REQUIREMENTS = {
+    value: "".join(_P_INFO + line + "\n" for line in lines)
+    for value, lines in {
+        "green": (
+            "Requirements: Document and proceed.",
+        ),
+        "yellow": (
+            "Requirements: Document, monitor, consequences checklist optional.",
+        ),
+        "orange": (
+            "Requirements: Safer alternatives REQUIRED.",
+            "              Red team review REQUIRED (including empathy pass).",
+            "              Consequences checklist REQUIRED.",
+            "              Epistemic fence REQUIRED.",
+        ),
+        "red": (
+            "Requirements: All ORANGE requirements PLUS:",
+            "              Must justify why safer alternatives cannot meet need.",
+            "              Transparency note in output.",
+        ),
+        "black": (
+            "Requirements: REFUSE or ESCALATE only.",
+            "              Cannot proceed under any circumstances.",
+        ),
+    }.items()
+}
+
+# Printed after the critical flags summary when A/C/D flags are raised
+_RERUN_REQUIRED = "\n" + "".join(_P_ERROR + line + "\n" for line in (
+    "Critical flags in categories A/C/D require:",
+    "  - Door/Wall/Gap re-run",
+    "  - Constraint Awareness check re-run",
+    "  - Safer alternative search",
+))
+
+# Choice lists mirroring the enumerations in pbhp_core
+_IMPACT_CHOICES = ("trivial", "moderate", "severe", "catastrophic")
+_LIKELIHOOD_CHOICES = ("unlikely", "possible", "likely", "imminent")
+_UNCERTAINTY_CHOICES = (
+    "S (solid -- multiple sources agree)",
+    "F (fuzzy -- analysts disagree, incomplete data)",
+    "X (speculative -- conjectural, theoretical)",
+)
+_DECISION_CHOICES = (
+    "proceed", "proceed_modified", "redirect",
+    "delay", "refuse", "escalate",
+)
+_BLACK_DECISION_CHOICES = ("refuse", "escalate")
+_MODE_CHOICES = ("explore", "compress")
+_CONFIDENCE_CHOICES = ("low", "medium-low", "medium", "medium-high", "high")
+
+# Step 0g: modes in which an absolute-rejection topic may still be discussed
+_PERMITTED_ANALYSIS_MODES = ("critique", "dismantling", "prevention")
+_ANALYSIS_MODE_CHOICES = _PERMITTED_ANALYSIS_MODES + ("none of these",)
+
+# Answer tables for yes/no and yes/no/unsure prompts (None = unsure)
+_YES_NO_MAP = {"y": True, "yes": True, "n": False, "no": False}
+_YN_UNSURE_MAP = {**_YES_NO_MAP, "u": None, "unsure": None, "": None}
+
+# Risk classes (by value) for which the deeper review steps are mandatory
+_REVIEW_REQUIRED_RISKS = frozenset(("orange", "red", "black"))
+# ... and for which the consequences checklist is at least offered
+_CHECKLIST_RISKS = _REVIEW_REQUIRED_RISKS | {"yellow"}
+
 # ---------------------------------------------------------------------------
 # Display helpers
 # ---------------------------------------------------------------------------
 
 
-def banner(title, char="="):
-    """Print a section banner."""
-    print()
-    print(char * BANNER_WIDTH)
-    print("  " + title)
-    print(char * BANNER_WIDTH)
+def _bar(char):
+    """Return a full-width separator bar for the given character."""
+    bar = _BARS.get(char)
+    if bar is None:
+        bar = char * BANNER_WIDTH
+    return bar
+
+
+def banner(title, char="=", body=None):
+    """Print a section banner, optionally followed by a block of body text."""
+    bar = _bar(char)
+    if body is None:
+        sys.stdout.write(f"\n{bar}\n  {title}\n{bar}\n")
+    else:
+        sys.stdout.write(f"\n{bar}\n  {title}\n{bar}\n{body}\n")
 
 
 def sub_banner(title, char="-"):
     """Print a subsection banner."""
-    print()
-    print(char * BANNER_WIDTH)
-    print("  " + title)
-    print(char * BANNER_WIDTH)
+    bar = _bar(char)
+    sys.stdout.write(f"\n{bar}\n  {title}\n{bar}\n")
 
 
 def info(msg):
     """Print an informational message."""
-    print("  [INFO] " + msg)
+    sys.stdout.write(f"{_P_INFO}{msg}\n")
 
 
 def warn(msg):
     """Print a warning message."""
-    print("  [WARN] " + msg)
+    sys.stdout.write(f"{_P_WARN}{msg}\n")
 
 
 def error(msg):
     """Print an error message."""
-    print("  [ERROR] " + msg)
+    sys.stdout.write(f"{_P_ERROR}{msg}\n")
 
 
 def success(msg):
     """Print a success message."""
-    print("  [OK] " + msg)
+    sys.stdout.write(f"{_P_SUCCESS}{msg}\n")
 
 
 def drift_alarm(msg):
     """Print a drift alarm."""
-    print("  [DRIFT ALARM] " + msg)
+    sys.stdout.write(f"{_P_DRIFT_ALARM}{msg}\n")
+
+
+def drift_alarms(msgs):
+    """Print a batch of drift alarms in a single write."""
+    sys.stdout.write("".join(f"{_P_DRIFT_ALARM}{msg}\n" for msg in msgs))
+
+
+@lru_cache(maxsize=256)
+def _fmt_prompt(msg, default=""):
+    """Format the prompt line shown by prompt()."""
+    if default:
+        return f"  > {msg} [{default}]: "
+    return f"  > {msg}: "
 
 
 def prompt(msg, default=""):
     """Prompt the user for input with an optional default."""
+    raw = input(_fmt_prompt(msg, default)).strip()
     if default:
-        raw = input("  > " + msg + " [" + default + "]: ").strip()
         return raw if raw else default
-    return input("  > " + msg + ": ").strip()
+    return raw
 
 
 def prompt_yes_no(msg, default=None):
@@ -131,10 +292,9 @@ def prompt_yes_no(msg, default=None):
         hint = "y/N"
     while True:
         raw = input("  > " + msg + " (" + hint + "): ").strip().lower()
-        if raw in ("y", "yes"):
-            return True
-        if raw in ("n", "no"):
-            return False
+        answer = _YES_NO_MAP.get(raw)
+        if answer is not None:
+            return answer
         if raw == "" and default is not None:
             return default
         print("    Please enter 'y' or 'n'.")
@@ -144,60 +304,188 @@ def prompt_yes_no_unsure(msg):
     """Prompt for yes/no/unsure. Returns True, False, or None (unsure)."""
     while True:
         raw = input("  > " + msg + " (y/n/unsure): ").strip().lower()
-        if raw in ("y", "yes"):
-            return True
-        if raw in ("n", "no"):
-            return False
-        if raw in ("u", "unsure", ""):
-            return None
+        try:
+            return _YN_UNSURE_MAP[raw]
+        except KeyError:
+            pass
         print("    Please enter 'y', 'n', or 'unsure'.")
 
 
+_FORM_HEADER = (
+    "# Answer each question on the lines below its '## ' heading.\n"
+    "# Lines starting with '#' are ignored. Save and close when done.\n\n"
+)
+
+
+def _parse_form(text, count):
+    """Split an edited form into answers; None if headings were altered."""
+    answers = []
+    for line in text.splitlines():
+        if line.startswith("## "):
+            answers.append([])
+        elif answers and line.strip() and not line.startswith("#"):
+            answers[-1].append(line.strip())
+    if len(answers) != count:
+        return None
+    return [" ".join(lines) for lines in answers]
+
+
+def _edit_form(questions):
+    """Open all questions in the editor at once; None on any failure."""
+    import shlex
+    import subprocess
+    import tempfile
+
+    fd, path = tempfile.mkstemp(prefix="pbhp_form_", suffix=".md", text=True)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(_FORM_HEADER + "".join("## " + q + "\n\n" for q in questions))
+        try:
+            status = subprocess.run(shlex.split(_form_editor) + [path]).returncode
+        except OSError:
+            status = None
+        if status != 0:
+            warn("Editor did not exit cleanly; asking one question at a time.")
+            return None
+        with open(path, encoding="utf-8") as f:
+            answers = _parse_form(f.read(), len(questions))
+    finally:
+        os.unlink(path)
+    if answers is None:
+        warn("Form headings were changed; asking one question at a time.")
+    return answers
+
+
+def prompt_form(questions):
+    """
+    Ask several free-text questions together.
+
+    With --editor on a terminal, the questions open as a single template
+    in $VISUAL / $EDITOR; otherwise (or if editing fails) each is asked
+    in turn. Returns the answers in question order.
+    """
+    if _form_editor and sys.stdin.isatty():
+        answers = _edit_form(questions)
+        if answers is not None:
+            return answers
+    return [prompt(q) for q in questions]
+
+
+@lru_cache(maxsize=32)
+def _choice_menu(options):
+    """
+    Render the numbered option lines for a tuple of options and build
+    the answer lookup: typed text (first match wins) and option numbers
+    both map to the option. Cached per options tuple.
+    """
+    menu = "".join(f"    {i}. {opt}\n" for i, opt in enumerate(options, 1))
+    lookup = {}
+    for o in options:
+        lookup.setdefault(o.lower(), o)
+    # Numbers take precedence over option text
+    lookup.update((str(i), o) for i, o in enumerate(options, 1))
+    return menu, lookup
+
+
 def prompt_choice(msg, options):
     """Prompt the user to choose from a numbered list of options."""
-    print("\n  " + msg)
-    for i, opt in enumerate(options, 1):
-        print("    " + str(i) + ". " + opt)
+    options = tuple(options)
+    menu, lookup = _choice_menu(options)
+    sys.stdout.write("\n  " + msg + "\n" + menu)
     while True:
-        raw = input("  > Choice: ").strip()
-        if raw.isdigit():
-            idx = int(raw) - 1
-            if 0 <= idx < len(options):
-                return options[idx]
-        # Allow typing the option text directly
-        for o in options:
-            if o.lower() == raw.lower():
-                return o
+        key = input("  > Choice: ").strip().lower()
+        if key not in lookup:
+            try:
+                key = str(int(key))  # e.g. "02" -> "2"
+            except ValueError:
+                pass
+        match = lookup.get(key)
+        if match is not None:
+            return match
         print("    Please enter a number 1-" + str(len(options)) + ".")
 
 
-def prompt_list(msg):
-    """Prompt for a list of items, one per line. Empty line to finish."""
-    print("  " + msg + " (enter one per line, blank line to finish):")
+def prompt_list(msg, sep=None):
+    """
+    Prompt for a list of items, one per line. Empty line to finish.
+
+    With ``sep`` set, the first line may instead hold the whole list
+    separated by ``sep`` (e.g. "alice; bob; carol"), which ends the
+    prompt after a single read.
+    """
+    if sep:
+        print("  " + msg + " (one per line, blank line to finish;"
+              " or all on one line separated by '" + sep + "'):")
+    else:
+        print("  " + msg + " (enter one per line, blank line to finish):")
     items = []
-    while True:
-        raw = input("    + ").strip()
+    items_append = items.append
+    stdin = sys.stdin
+    if not stdin.isatty():
+        # Piped input: read straight from the buffered stream
+        lines = stdin
+    else:
+        lines = iter(lambda: input("    + "), None)
+    for raw in lines:
+        raw = raw.strip()
         if not raw:
             break
-        items.append(raw)
+        if sep and not items and sep in raw:
+            return [part for part in map(str.strip, raw.split(sep)) if part]
+        items_append(raw)
     return items
 
 
+@lru_cache(maxsize=8)
 def display_risk_class(risk):
     """Format a risk class for display with description."""
-    labels = {
-        RiskClass.GREEN:  "GREEN  - Low risk, proceed normally",
-        RiskClass.YELLOW: "YELLOW - Moderate risk, document and monitor",
-        RiskClass.ORANGE: "ORANGE - High risk, alternatives + red team required",
-        RiskClass.RED:    "RED    - Very high risk, must justify why alternatives fail",
-        RiskClass.BLACK:  "BLACK  - Extreme risk, refuse or escalate only",
-    }
-    return labels.get(risk, risk.value.upper())
+    return _RISK_LABELS.get(risk.value) or risk.value.upper()
 
 
+@lru_cache(maxsize=8)
 def display_risk_color(risk):
     """Return the risk class name in uppercase."""
-    return risk.value.upper()
+    return _RISK_COLORS.get(risk.value) or risk.value.upper()
+
+
+@lru_cache(maxsize=8)
+def display_outcome(outcome):
+    """Return the decision outcome name in uppercase."""
+    return sys.intern(outcome.value.upper())
+
+
+def _member(enum_cls, value):
+    """
+    Look up an enum member by value.
+
+    Choice values come from the fixed tuples above, so this reads the
+    enum's value map directly instead of going through Enum.__call__.
+    """
+    return enum_cls._value2member_map_[value]
+
+
+def _file_stamp():
+    """Local-time stamp for default export file names (YYYYmmdd_HHMMSS)."""
+    return time.strftime("%Y%m%d_%H%M%S")
+
+
+def review_required(log):
+    """True if the log's risk class makes the deeper review steps mandatory."""
+    return log.highest_risk_class.value in _REVIEW_REQUIRED_RISKS
+
+
+def opt_in_review(log, title, question):
+    """
+    Show a review step banner and decide whether to run it.
+
+    Required reviews announce themselves and always run; optional ones
+    ask first, so a declined review does no further work.
+    """
+    banner(title)
+    if review_required(log):
+        print("\n  REQUIRED for " + display_risk_color(log.highest_risk_class) + " risk class.")
+        return True
+    return prompt_yes_no(question, default=False)
 
 
 def pause_continue():
@@ -220,8 +508,7 @@ def step_00_protocol_understanding():
     Verifies the user has a basic grasp of PBHP before proceeding.
     Returns True if confirmed, False otherwise.
     """
-    banner("Step 00: Protocol Understanding (Competence Gate)")
-    print("""
+    banner("Step 00: Protocol Understanding (Competence Gate)", body="""
   Before running a full PBHP assessment, please confirm you understand
   the core principles:
 
@@ -261,8 +548,7 @@ def step_0a_ethical_pause(engine, log):
     High arousal check.
     Returns True to continue, False to pause the assessment.
     """
-    banner("Step 0a: Ethical Pause")
-    print("""
+    banner("Step 0a: Ethical Pause", body="""
   Pause and balance three forces before proceeding:
     - Compassion / Empathy / Love / Protection / Courage
     - Logic / Intelligence / Clarity / Craft / Responsibility
@@ -276,9 +562,11 @@ def step_0a_ethical_pause(engine, log):
         default=log.action_description
     )
     print()
-    compassion = prompt("Compassion lens -- who could be hurt, who needs protection?")
-    logic = prompt("Logic lens -- what are the facts, what is the clearest path?")
-    paradox = prompt("Paradox lens -- what am I missing, what contradictions exist?")
+    compassion, logic, paradox = prompt_form((
+        "Compassion lens -- who could be hurt, who needs protection?",
+        "Logic lens -- what are the facts, what is the clearest path?",
+        "Paradox lens -- what am I missing, what contradictions exist?",
+    ))
 
     print()
     high_arousal = prompt_yes_no(
@@ -321,8 +609,7 @@ def step_0d_quick_risk_check(engine, log):
     Step 0d: Quick Risk Check (pre-screening).
     Returns the QuickRiskCheck object.
     """
-    banner("Step 0d: Quick Risk Check (Pre-Screening)")
-    print("""
+    banner("Step 0d: Quick Risk Check (Pre-Screening)", body="""
   Fast pre-screening before the full protocol.
   Two questions to determine if behavior should tighten.
 """)
@@ -351,20 +638,14 @@ def step_0d_quick_risk_check(engine, log):
 
 def standalone_quick_risk_check():
     """Standalone quick risk check (from main menu)."""
-    banner("Quick Risk Check")
-    print("""
+    _load_core()
+    banner("Quick Risk Check", body="""
   Quickly calculate a risk class from four parameters.
   No full assessment required.
 """)
 
-    impact_str = prompt_choice(
-        "Impact level:",
-        ["trivial", "moderate", "severe", "catastrophic"]
-    )
-    likelihood_str = prompt_choice(
-        "Likelihood:",
-        ["unlikely", "possible", "likely", "imminent"]
-    )
+    impact_str = prompt_choice("Impact level:", _IMPACT_CHOICES)
+    likelihood_str = prompt_choice("Likelihood:", _LIKELIHOOD_CHOICES)
     irreversible = prompt_yes_no("Is the harm irreversible?", default=False)
     power_asym = prompt_yes_no("Is there a power asymmetry?", default=False)
 
@@ -374,7 +655,7 @@ def standalone_quick_risk_check():
     print("  Risk Class: " + display_risk_class(risk))
     print()
 
-    if risk in (RiskClass.ORANGE, RiskClass.RED, RiskClass.BLACK):
+    if risk.value in _REVIEW_REQUIRED_RISKS:
         warn("This risk level requires a full PBHP assessment.")
         warn("Use 'Start New Assessment' from the main menu for the complete walkthrough.")
 
@@ -391,8 +672,8 @@ def step_0g_absolute_rejection(engine, log):
     Returns True if the action passes (no rejection triggered).
     Returns False if the action is absolutely rejected.
     """
-    banner("Step 0g: Absolute Rejection Check")
-    print("""
+    _load_core()
+    banner("Step 0g: Absolute Rejection Check", body="""
   Checking whether this action upholds:
     - Fascism
     - Genocide
@@ -407,14 +688,14 @@ def step_0g_absolute_rejection(engine, log):
     check = engine.perform_absolute_rejection_check(log)
 
     if check.triggers_rejection:
-        error("ABSOLUTE REJECTION TRIGGERED.")
-        print("  Matched categories: " + ", ".join(check.matched_categories))
-        print()
+        sys.stdout.write(_P_ERROR + "ABSOLUTE REJECTION TRIGGERED.\n"
+                         "  Matched categories: "
+                         + ", ".join(check.matched_categories) + "\n\n")
         analysis = prompt_choice(
             "Is this discussion in one of the permitted modes?",
-            ["critique", "dismantling", "prevention", "none of these"]
+            _ANALYSIS_MODE_CHOICES
         )
-        if analysis in ("critique", "dismantling", "prevention"):
+        if analysis in _PERMITTED_ANALYSIS_MODES:
             check.analysis_mode = analysis
             log.absolute_rejection = check
             # Reset the forced refusal so assessment can continue
@@ -442,8 +723,7 @@ def step_1_name_action(engine, log):
     Step 1: Name the Action (with validation).
     Returns True if action is accepted.
     """
-    banner("Step 1: Name the Action")
-    print("""
+    banner("Step 1: Name the Action", body="""
   State the action clearly and honestly.
   Truth check: Is this honest and complete enough that a skeptical
   outsider would recognize what you are doing?
@@ -475,8 +755,7 @@ def step_0e_door_wall_gap(engine, log):
     Step 0e: Door/Wall/Gap analysis.
     Returns True if a concrete Door is identified.
     """
-    banner("Step 0e: Door / Wall / Gap Analysis")
-    print("""
+    banner("Step 0e: Door / Wall / Gap Analysis", body="""
   Mandatory micro-module to prevent PBHP from defaulting inside
   an imposed system.
 
@@ -491,23 +770,24 @@ def step_0e_door_wall_gap(engine, log):
   or a slogan.
 """)
 
-    wall = prompt("WALL - What constraint are you operating inside?")
-    gap = prompt("GAP  - Where could harm leak through despite good intent?")
-    door = prompt("DOOR - Smallest real escape vector (concrete action)?")
-
-    has_door = engine.perform_door_wall_gap(log, wall=wall, gap=gap, door=door)
+    while True:
+        wall = prompt("WALL - What constraint are you operating inside?")
+        gap = prompt("GAP  - Where could harm leak through despite good intent?")
+        door = prompt("DOOR - Smallest real escape vector (concrete action)?")
+
+        # Only the attempt the user settles on is recorded in the log
+        if engine.perform_door_wall_gap(log, wall=wall, gap=gap, door=door,
+                                        provisional=True):
+            engine.perform_door_wall_gap(log, wall=wall, gap=gap, door=door)
+            success("Door identified: " + door)
+            return True
 
-    if not has_door:
         error("No concrete Door identified.")
         error("PBHP does not permit proceeding without an escape vector.")
         warn("Consider: delay, verify, narrow scope, refuse, or escalate.")
-        retry = prompt_yes_no("Would you like to try again?", default=True)
-        if retry:
-            return step_0e_door_wall_gap(engine, log)
-        return False
-
-    success("Door identified: " + door)
-    return True
+        if not prompt_yes_no("Would you like to try again?", default=True):
+            engine.perform_door_wall_gap(log, wall=wall, gap=gap, door=door)
+            return False
 
 
 # -------------------------------------------------------------------
@@ -519,8 +799,7 @@ def step_0f_constraint_awareness_check(engine, log):
     Step 0f: Constraint Awareness Check - Agency Under Constraint.
     Returns True if check passes (agency maintained).
     """
-    banner("Step 0f: Constraint Awareness Check (Agency Under Constraint)")
-    print("""
+    banner("Step 0f: Constraint Awareness Check (Agency Under Constraint)", body="""
   Prevents surrender of agency to perceived inevitability.
 
   If the system cannot name a remaining choice, PBHP must pause
@@ -531,41 +810,40 @@ def step_0f_constraint_awareness_check(engine, log):
   re-run for each.
 """)
 
-    constraint = prompt_yes_no(
-        "Do you recognize a constraint on your action?", default=True
-    )
-    no_choice = prompt_yes_no(
-        "Are you claiming there is no choice?", default=False
-    )
-    remaining = ""
-    reframes = []
-    if no_choice:
-        remaining = prompt(
-            "Despite the constraint, what remaining choice can you name? (blank if none)"
+    while True:
+        constraint = prompt_yes_no(
+            "Do you recognize a constraint on your action?", default=True
         )
-        if not remaining:
-            warn("No remaining choice identified. PBHP requires reframing.")
-            reframes = prompt_list("Provide alternative framings of this problem")
-    else:
-        remaining = prompt("What remaining choice do you have?")
+        no_choice = prompt_yes_no(
+            "Are you claiming there is no choice?", default=False
+        )
+        remaining = ""
+        reframes = []
+        if no_choice:
+            remaining = prompt(
+                "Despite the constraint, what remaining choice can you name? (blank if none)"
+            )
+            if not remaining:
+                warn("No remaining choice identified. PBHP requires reframing.")
+                reframes = prompt_list("Provide alternative framings of this problem", sep=";")
+        else:
+            remaining = prompt("What remaining choice do you have?")
 
-    passed = engine.perform_constraint_awareness_check(
-        log,
-        constraint_recognized=constraint,
-        no_choice_claim=no_choice,
-        remaining_choice=remaining,
-        reframes=reframes,
-    )
+        if engine.perform_constraint_awareness_check(
+            log,
+            constraint_recognized=constraint,
+            no_choice_claim=no_choice,
+            remaining_choice=remaining,
+            reframes=reframes,
+        ):
+            break
 
-    if not passed:
         error("Constraint Awareness check requires PAUSE.")
         if log.constraint_awareness_check and log.constraint_awareness_check.consecutive_no_choice_count >= 2:
             error("'No choice' claimed twice in a row.")
             error("Must provide at least 2 alternative framings and re-run Door/Wall/Gap.")
-        retry = prompt_yes_no("Would you like to retry?", default=True)
-        if retry:
-            return step_0f_constraint_awareness_check(engine, log)
-        return False
+        if not prompt_yes_no("Would you like to retry?", default=True):
+            return False
 
     success("Constraint Awareness check passed. Agency maintained.")
     return True
@@ -577,8 +855,8 @@ def step_0f_constraint_awareness_check(engine, log):
 
 def step_2_identify_harms(engine, log):
     """Step 2: Identify potential harms (loop)."""
-    banner("Step 2: Identify Potential Harms")
-    print("""
+    _load_core()
+    banner("Step 2: Identify Potential Harms", body="""
   Identify all potential harms from this action.
   For each harm, you will specify:
     - Description of the potential harm
@@ -603,32 +881,20 @@ def step_2_identify_harms(engine, log):
                 continue
             break
 
-        impact_str = prompt_choice("Impact level:", [
-            "trivial", "moderate", "severe", "catastrophic"
-        ])
-        likelihood_str = prompt_choice("Likelihood:", [
-            "unlikely", "possible", "likely", "imminent"
-        ])
+        impact_str = prompt_choice("Impact level:", _IMPACT_CHOICES)
+        likelihood_str = prompt_choice("Likelihood:", _LIKELIHOOD_CHOICES)
         irreversible = prompt_yes_no("Is this harm irreversible?", default=False)
         power_asym = prompt_yes_no(
             "Is there a power asymmetry (harm lands on low-power group)?",
             default=False
         )
 
-        affected = prompt_list("Who are the affected parties?")
+        affected = prompt_list("Who are the affected parties?", sep=";")
         least_powerful = prompt("Who is the least powerful among the affected?")
 
-        uncertainty_str = prompt_choice("Uncertainty level:", [
-            "S (solid -- multiple sources agree)",
-            "F (fuzzy -- analysts disagree, incomplete data)",
-            "X (speculative -- conjectural, theoretical)",
-        ])
-        unc_map = {
-            "S": UncertaintyLevel.SOLID,
-            "F": UncertaintyLevel.FUZZY,
-            "X": UncertaintyLevel.SPECULATIVE,
-        }
-        uncertainty = unc_map.get(uncertainty_str[0], UncertaintyLevel.FUZZY)
+        uncertainty_str = prompt_choice("Uncertainty level:", _UNCERTAINTY_CHOICES)
+        # Each choice starts with its UncertaintyLevel value (S/F/X)
+        uncertainty = _member(UncertaintyLevel, uncertainty_str[0])
 
         evidence = prompt("Evidence basis (brief description)", default="")
         audience_risk = prompt_yes_no(
@@ -639,8 +905,8 @@ def step_2_identify_harms(engine, log):
         harm = engine.add_harm(
             log,
             description=desc,
-            impact=ImpactLevel(impact_str),
-            likelihood=LikelihoodLevel(likelihood_str),
+            impact=_member(ImpactLevel, impact_str),
+            likelihood=_member(LikelihoodLevel, likelihood_str),
             irreversible=irreversible,
             power_asymmetry=power_asym,
             affected_parties=affected,
@@ -673,38 +939,24 @@ def step_3_risk_display(log):
     banner("Step 3: Risk Classification")
 
     risk = log.highest_risk_class
-    print("\n  Overall Risk Class: " + display_risk_class(risk))
-    print()
-
-    if risk == RiskClass.GREEN:
-        info("Requirements: Document and proceed.")
-    elif risk == RiskClass.YELLOW:
-        info("Requirements: Document, monitor, consequences checklist optional.")
-    elif risk == RiskClass.ORANGE:
-        info("Requirements: Safer alternatives REQUIRED.")
-        info("              Red team review REQUIRED (including empathy pass).")
-        info("              Consequences checklist REQUIRED.")
-        info("              Epistemic fence REQUIRED.")
-    elif risk == RiskClass.RED:
-        info("Requirements: All ORANGE requirements PLUS:")
-        info("              Must justify why safer alternatives cannot meet need.")
-        info("              Transparency note in output.")
-    elif risk == RiskClass.BLACK:
-        info("Requirements: REFUSE or ESCALATE only.")
-        info("              Cannot proceed under any circumstances.")
+    sys.stdout.write("\n  Overall Risk Class: " + display_risk_class(risk) + "\n\n"
+                     + _RISK_REQUIREMENTS.get(risk.value, ""))
 
     # List all harms with their individual risk classes
     if log.harms:
         sub_banner("Individual Harm Risk Classes")
+        lines = []
+        lines_append = lines.append
         for i, h in enumerate(log.harms, 1):
             hr = h.calculate_risk_class()
-            print("  " + str(i) + ". [" + display_risk_color(hr) + "] " + h.description)
-            print("     Impact: " + h.impact.value
-                  + " | Likelihood: " + h.likelihood.value
-                  + " | Irreversible: " + str(h.irreversible)
-                  + " | Power Asymmetry: " + str(h.power_asymmetry))
+            lines_append(f"  {i}. [{display_risk_color(hr)}] {h.description}\n"
+                         f"     Impact: {h.impact.value}"
+                         f" | Likelihood: {h.likelihood.value}"
+                         f" | Irreversible: {h.irreversible}"
+                         f" | Power Asymmetry: {h.power_asymmetry}\n")
             if h.audience_risk_elevated:
-                print("     * Audience risk elevated (risk class bumped up one level)")
+                lines_append("     * Audience risk elevated (risk class bumped up one level)\n")
+        sys.stdout.write("".join(lines))
 
     pause_continue()
 
@@ -715,8 +967,7 @@ def step_3_risk_display(log):
 
 def step_4_consent_check(engine, log):
     """Step 4: Consent and Representation Check."""
-    banner("Step 4: Consent and Representation Check")
-    print("""
+    banner("Step 4: Consent and Representation Check", body="""
   Would the affected parties reasonably agree if they understood
   the situation?
 """)
@@ -741,7 +992,7 @@ def step_4_consent_check(engine, log):
         "Is the framing honest (no euphemisms hiding real impact)?",
         default=True
     )
-    who_no_say = prompt_list("Who did NOT get a say in this decision?")
+    who_no_say = prompt_list("Who did NOT get a say in this decision?", sep=";")
     notes = prompt("Notes on consent analysis (optional)", default="")
 
     check = engine.perform_consent_check(
@@ -772,9 +1023,7 @@ def step_4_consent_check(engine, log):
 
 def step_5_alternatives(engine, log):
     """Step 5: Safer Alternatives (required for ORANGE+)."""
-    required = log.highest_risk_class in (
-        RiskClass.ORANGE, RiskClass.RED, RiskClass.BLACK
-    )
+    required = review_required(log)
     banner("Step 5: Safer Alternatives")
     if required:
         print("\n  REQUIRED for " + display_risk_color(log.highest_risk_class) + " risk class.")
@@ -827,31 +1076,25 @@ def step_5_alternatives(engine, log):
 
 def step_6_5_red_team(engine, log):
     """Step 6.5: Red Team Review (required for ORANGE+, includes empathy pass)."""
-    required = log.highest_risk_class in (
-        RiskClass.ORANGE, RiskClass.RED, RiskClass.BLACK
-    )
-    banner("Step 6.5: Red Team Review")
-    if required:
-        print("\n  REQUIRED for " + display_risk_color(log.highest_risk_class) + " risk class.")
-    else:
-        if not prompt_yes_no(
-            "Run red team review? (optional for this risk class)", default=False
-        ):
-            return
+    if not opt_in_review(
+        log, "Step 6.5: Red Team Review",
+        "Run red team review? (optional for this risk class)",
+    ):
+        return
     print("""
   Adversarial stress test of the proposed action.
   Answer all questions honestly -- the point is to find weaknesses.
 """)
 
     sub_banner("Core Questions")
-    failure_modes = prompt_list("What are the possible failure modes?")
-    abuse_vectors = prompt_list("How could this be abused or misused?")
+    failure_modes = prompt_list("What are the possible failure modes?", sep=";")
+    abuse_vectors = prompt_list("How could this be abused or misused?", sep=";")
     who_bears = prompt("Who bears the most risk if this goes wrong?")
     false_assumptions = prompt_list("What false assumptions might we be making?")
     norm_risk = prompt("What norms does this risk normalizing?", default="")
 
     sub_banner("Epistemic Questions")
-    alt_interps = prompt_list("What alternative interpretations exist?")
+    alt_interps = prompt_list("What alternative interpretations exist?", sep=";")
     claim_tags = prompt(
         "Which parts are [F]act vs [I]nference/[H]ypothesis/[S]peculative?",
         default=""
@@ -896,8 +1139,7 @@ def step_6_5_red_team(engine, log):
     # Display drift alarms from red team
     if review.drift_alarms_detected:
         print()
-        for da in review.drift_alarms_detected:
-            drift_alarm(da)
+        drift_alarms(review.drift_alarms_detected)
 
     # Determine mitigation
     sub_banner("Mitigation")
@@ -931,12 +1173,13 @@ def step_6_5_red_team(engine, log):
 
 def step_6_7_decision(engine, log):
     """Steps 6-7: Decision and Justification."""
+    _load_core()
     banner("Steps 6-7: Decision and Justification")
 
     # For BLACK risk, restrict choices
     if log.highest_risk_class == RiskClass.BLACK:
         print("\n  Risk class is BLACK. Only REFUSE or ESCALATE are permitted.\n")
-        outcome_str = prompt_choice("Decision:", ["refuse", "escalate"])
+        outcome_str = prompt_choice("Decision:", _BLACK_DECISION_CHOICES)
     else:
         print("""
   Choose your decision outcome based on the full assessment.
@@ -948,12 +1191,9 @@ def step_6_7_decision(engine, log):
     refuse           - Refuse to take the action
     escalate         - Escalate to a higher authority
 """)
-        outcome_str = prompt_choice("Decision:", [
-            "proceed", "proceed_modified", "redirect",
-            "delay", "refuse", "escalate"
-        ])
+        outcome_str = prompt_choice("Decision:", _DECISION_CHOICES)
 
-    outcome = DecisionOutcome(outcome_str)
+    outcome = _member(DecisionOutcome, outcome_str)
 
     print()
     justification = prompt("Provide your justification (detailed)")
@@ -961,7 +1201,7 @@ def step_6_7_decision(engine, log):
     # RED requires explanation of why alternatives fail
     if (log.highest_risk_class == RiskClass.RED
             and outcome in (DecisionOutcome.PROCEED, DecisionOutcome.PROCEED_MODIFIED)):
-        if "safer alternative" not in justification.lower():
+        if not mentions_safer_alternative(justification):
             warn("RED risk class requires justification of why safer alternatives")
             warn("cannot meet the legitimate need. Please include this.")
             extra = prompt("Why can safer alternatives not meet the need?")
@@ -972,11 +1212,10 @@ def step_6_7_decision(engine, log):
     # Display drift alarms found during finalization
     if log.drift_alarms_triggered:
         sub_banner("Drift Alarms Detected During Finalization")
-        for da in log.drift_alarms_triggered:
-            drift_alarm(da)
+        drift_alarms(log.drift_alarms_triggered)
 
     print()
-    info("Decision: " + outcome.value.upper())
+    info("Decision: " + display_outcome(outcome))
     info("Risk class: " + display_risk_color(log.highest_risk_class))
 
 
@@ -984,23 +1223,113 @@ def step_6_7_decision(engine, log):
 # Consequences Checklist
 # -------------------------------------------------------------------
 
+# Checklist sections in order: (sub-banner, ((field, kind, question), ...)).
+# Kinds map to prompt helpers through _CHECKLIST_PROMPTS; runs of "text"
+# questions go through prompt_form() so --editor can answer them together.
+_CONSEQUENCES_SCHEMA = (
+    ("A. Baseline Reality Check", (
+        ("historical_analogs", "list",
+         "Name historical analogs to this action"),
+        ("past_harms_unpredicted", "list",
+         "What harms were unpredicted in those analogs?"),
+        ("past_mitigation_failures", "list",
+         "What mitigations failed in those cases?"),
+        ("past_disproportionate_groups", "list",
+         "Which groups were disproportionately harmed?"),
+        ("past_defender_claims", "list",
+         "What did defenders claim about those cases?"),
+    )),
+    ("B. Status Quo Harm Audit", (
+        ("current_harm_if_nothing", "text",
+         "What harm continues if nothing is done?"),
+        ("who_benefits_status_quo", "text",
+         "Who benefits from the status quo?"),
+        ("inaction_continues_harm", "ynu",
+         "Does inaction continue harm?"),
+    )),
+    ("C. Time Horizon Scan", (
+        ("immediate_harms", "text", "Immediate harms (0-72 hours)?"),
+        ("short_term_harms", "text", "Short-term harms (1-12 weeks)?"),
+        ("medium_term_harms", "text", "Medium-term harms (3-24 months)?"),
+        ("long_term_harms", "text", "Long-term harms (2-10+ years)?"),
+        ("any_horizon_irreversible", "yn",
+         "Is any of the above irreversible?"),
+    )),
+    ("D. Cultural and Institutional Effects (Q5-Q8)", (
+        ("normalizes_harm", "ynu", "Q5: Does this normalize harm?"),
+        ("shifts_to_ends_justify_means", "ynu",
+         "Q6: Does this shift toward 'ends justify means' thinking?"),
+        ("erodes_institutional_trust", "ynu",
+         "Q7: Does this erode institutional trust?"),
+        ("rewards_bad_behavior", "ynu", "Q8: Does this reward bad behavior?"),
+    )),
+    ("E. Power and Representation Effects (Q9-Q12)", (
+        ("burdens_fall_on_low_power", "ynu",
+         "Q9: Do burdens fall on low-power groups?"),
+        ("reduces_exit_appeal_optout", "ynu",
+         "Q10: Does this reduce exit/appeal/opt-out options?"),
+        ("increases_surveillance_coercion", "ynu",
+         "Q11: Does this increase surveillance or coercion?"),
+        ("decision_makers_insulated", "ynu",
+         "Q12: Are decision-makers insulated from consequences?"),
+    )),
+    ("F. Drift and Abuse Resistance (Q13-Q15)", (
+        ("bad_actor_misuse", "text", "Q13: How could a bad actor misuse this?"),
+        ("adjacent_use_prediction", "text",
+         "Q14: What adjacent uses are predictable?"),
+        ("permanence_risk", "text", "Q15: What is the permanence risk?"),
+    )),
+    ("G. Narrative and Honesty Test (Q16-Q18)", (
+        ("can_describe_plainly_to_harmed", "ynu",
+         "Q16: Can you describe this action plainly to the person most harmed?"),
+        ("transparency_changes_consent", "ynu",
+         "Q17: Would full transparency change whether people consent?"),
+        ("relying_on_euphemism", "ynu",
+         "Q18: Are you relying on euphemism to make this palatable?"),
+    )),
+    ("H. Repair and Exit Requirements (Q19-Q22)", (
+        ("rollback_plan", "text", "Q19: What is the rollback plan?"),
+        ("sunset_condition", "text", "Q20: What is the sunset condition?"),
+        ("independent_stop_authority", "text",
+         "Q21: Who has independent authority to stop this?"),
+        ("smallest_door", "text",
+         "Q22: What is the smallest door (escape vector)?"),
+    )),
+)
+
+_CHECKLIST_PROMPTS = {
+    "list": lambda q: prompt_list(q, sep=";"),
+    "yn": lambda q: prompt_yes_no(q, default=False),
+    "ynu": prompt_yes_no_unsure,
+}
+
+
+def _ask_checklist_sections(cc, sections):
+    """Ask the schema questions for each section and fill in ``cc``."""
+    for title, questions in sections:
+        sub_banner(title)
+        for kind, run in groupby(questions, key=lambda entry: entry[1]):
+            run = tuple(run)
+            if kind == "text":
+                answers = prompt_form(tuple(q for _, _, q in run))
+            else:
+                ask = _CHECKLIST_PROMPTS[kind]
+                answers = [ask(q) for _, _, q in run]
+            for (field, _, _), answer in zip(run, answers):
+                setattr(cc, field, answer)
+
+
 def consequences_checklist_flow(engine, log):
     """
     Consequences Checklist -- optional for YELLOW, required for ORANGE+.
     22 questions across 6 categories.
     """
-    required = log.highest_risk_class in (
-        RiskClass.ORANGE, RiskClass.RED, RiskClass.BLACK
-    )
-    banner("Consequences Checklist")
-    if required:
-        print("\n  REQUIRED for " + display_risk_color(log.highest_risk_class) + " risk class.")
-    else:
-        if not prompt_yes_no(
-            "Run consequences checklist? (optional for this risk class)",
-            default=False
-        ):
-            return
+    _load_core()
+    if not opt_in_review(
+        log, "Consequences Checklist",
+        "Run consequences checklist? (optional for this risk class)",
+    ):
+        return
 
     print("""
   Temporal + Cultural Impact Modeling.
@@ -1009,132 +1338,34 @@ def consequences_checklist_flow(engine, log):
 """)
 
     cc = ConsequencesChecklist()
+    _ask_checklist_sections(cc, _CONSEQUENCES_SCHEMA[:4])
+
+    # Optional runs with a clean start may stop here. A partial checklist
+    # is not recorded: its unanswered questions would gate as "unsure".
+    if (not review_required(log)
+            and cc.early_sections_clear()
+            and prompt_yes_no(
+                "No flags in Q1-Q8. Stop here without recording the checklist?",
+                default=False,
+            )):
+        info("Consequences checklist skipped after Q8; nothing recorded.")
+        return
 
-    # --- Category A: Baseline Reality Check ---
-    sub_banner("A. Baseline Reality Check")
-    cc.historical_analogs = prompt_list(
-        "Name historical analogs to this action"
-    )
-    cc.past_harms_unpredicted = prompt_list(
-        "What harms were unpredicted in those analogs?"
-    )
-    cc.past_mitigation_failures = prompt_list(
-        "What mitigations failed in those cases?"
-    )
-    cc.past_disproportionate_groups = prompt_list(
-        "Which groups were disproportionately harmed?"
-    )
-    cc.past_defender_claims = prompt_list(
-        "What did defenders claim about those cases?"
-    )
-
-    # --- Category B: Status Quo Harm Audit ---
-    sub_banner("B. Status Quo Harm Audit")
-    cc.current_harm_if_nothing = prompt(
-        "What harm continues if nothing is done?"
-    )
-    cc.who_benefits_status_quo = prompt(
-        "Who benefits from the status quo?"
-    )
-    cc.inaction_continues_harm = prompt_yes_no_unsure(
-        "Does inaction continue harm?"
-    )
-
-    # --- Category C: Time Horizon Scan ---
-    sub_banner("C. Time Horizon Scan")
-    cc.immediate_harms = prompt("Immediate harms (0-72 hours)?", default="")
-    cc.short_term_harms = prompt("Short-term harms (1-12 weeks)?", default="")
-    cc.medium_term_harms = prompt("Medium-term harms (3-24 months)?", default="")
-    cc.long_term_harms = prompt("Long-term harms (2-10+ years)?", default="")
-    cc.any_horizon_irreversible = prompt_yes_no(
-        "Is any of the above irreversible?", default=False
-    )
-
-    # --- Category D: Cultural and Institutional Effects (Q5-Q8) ---
-    sub_banner("D. Cultural and Institutional Effects (Q5-Q8)")
-    cc.normalizes_harm = prompt_yes_no_unsure(
-        "Q5: Does this normalize harm?"
-    )
-    cc.shifts_to_ends_justify_means = prompt_yes_no_unsure(
-        "Q6: Does this shift toward 'ends justify means' thinking?"
-    )
-    cc.erodes_institutional_trust = prompt_yes_no_unsure(
-        "Q7: Does this erode institutional trust?"
-    )
-    cc.rewards_bad_behavior = prompt_yes_no_unsure(
-        "Q8: Does this reward bad behavior?"
-    )
-
-    # --- Category E: Power and Representation Effects (Q9-Q12) ---
-    sub_banner("E. Power and Representation Effects (Q9-Q12)")
-    cc.burdens_fall_on_low_power = prompt_yes_no_unsure(
-        "Q9: Do burdens fall on low-power groups?"
-    )
-    cc.reduces_exit_appeal_optout = prompt_yes_no_unsure(
-        "Q10: Does this reduce exit/appeal/opt-out options?"
-    )
-    cc.increases_surveillance_coercion = prompt_yes_no_unsure(
-        "Q11: Does this increase surveillance or coercion?"
-    )
-    cc.decision_makers_insulated = prompt_yes_no_unsure(
-        "Q12: Are decision-makers insulated from consequences?"
-    )
-
-    # --- Category F: Drift and Abuse Resistance (Q13-Q15) ---
-    sub_banner("F. Drift and Abuse Resistance (Q13-Q15)")
-    cc.bad_actor_misuse = prompt(
-        "Q13: How could a bad actor misuse this?", default=""
-    )
-    cc.adjacent_use_prediction = prompt(
-        "Q14: What adjacent uses are predictable?", default=""
-    )
-    cc.permanence_risk = prompt(
-        "Q15: What is the permanence risk?", default=""
-    )
-
-    # --- Category G: Narrative and Honesty Test (Q16-Q18) ---
-    sub_banner("G. Narrative and Honesty Test (Q16-Q18)")
-    cc.can_describe_plainly_to_harmed = prompt_yes_no_unsure(
-        "Q16: Can you describe this action plainly to the person most harmed?"
-    )
-    cc.transparency_changes_consent = prompt_yes_no_unsure(
-        "Q17: Would full transparency change whether people consent?"
-    )
-    cc.relying_on_euphemism = prompt_yes_no_unsure(
-        "Q18: Are you relying on euphemism to make this palatable?"
-    )
-
-    # --- Category H: Repair and Exit Requirements (Q19-Q22) ---
-    sub_banner("H. Repair and Exit Requirements (Q19-Q22)")
-    cc.rollback_plan = prompt(
-        "Q19: What is the rollback plan?", default=""
-    )
-    cc.sunset_condition = prompt(
-        "Q20: What is the sunset condition?", default=""
-    )
-    cc.independent_stop_authority = prompt(
-        "Q21: Who has independent authority to stop this?", default=""
-    )
-    cc.smallest_door = prompt(
-        "Q22: What is the smallest door (escape vector)?", default=""
-    )
+    _ask_checklist_sections(cc, _CONSEQUENCES_SCHEMA[4:])
 
     engine.set_consequences_checklist(log, cc)
 
     # Display critical flags
     flags = cc.has_critical_flags()
     sub_banner("Critical Flags Summary")
-    for flag_name, flag_val in flags.items():
-        status = "FLAGGED" if flag_val else "clear"
-        marker = "[!]" if flag_val else "[ ]"
-        print("  " + marker + " " + flag_name + ": " + status)
+    sys.stdout.write("".join(
+        f"  [!] {flag_name}: FLAGGED\n" if flag_val
+        else f"  [ ] {flag_name}: clear\n"
+        for flag_name, flag_val in flags.items()
+    ))
 
     if cc.requires_door_chim_rerun():
-        print()
-        error("Critical flags in categories A/C/D require:")
-        error("  - Door/Wall/Gap re-run")
-        error("  - Constraint Awareness check re-run")
-        error("  - Safer alternative search")
+        sys.stdout.write(_RERUN_REQUIRED)
 
 
 # -------------------------------------------------------------------
@@ -1143,6 +1374,7 @@ def consequences_checklist_flow(engine, log):
 
 def uncertainty_assessment_flow(engine, log):
     """Uncertainty Assessment -- optional but recommended."""
+    _load_core()
     banner("Uncertainty Assessment")
     if not prompt_yes_no("Run uncertainty assessment?", default=False):
         return
@@ -1228,17 +1460,8 @@ def uncertainty_assessment_flow(engine, log):
         "Can these questions be answered before any deadline?", default=True
     )
 
-    conf_str = prompt_choice("Overall confidence:", [
-        "low", "medium-low", "medium", "medium-high", "high"
-    ])
-    conf_map = {
-        "low": Confidence.LOW,
-        "medium-low": Confidence.MEDIUM_LOW,
-        "medium": Confidence.MEDIUM,
-        "medium-high": Confidence.MEDIUM_HIGH,
-        "high": Confidence.HIGH,
-    }
-    ua.confidence = conf_map[conf_str]
+    conf_str = prompt_choice("Overall confidence:", _CONFIDENCE_CHOICES)
+    ua.confidence = _member(Confidence, conf_str)
     ua.biggest_might_be_wrong = prompt(
         "What is the biggest thing you might be wrong about?"
     )
@@ -1251,19 +1474,23 @@ def uncertainty_assessment_flow(engine, log):
 # Epistemic Fence
 # -------------------------------------------------------------------
 
+def _iter_inferences():
+    """Yield (claim, confidence) pairs until a blank claim is entered."""
+    while True:
+        claim = prompt("    Inference claim (blank to finish)", default="")
+        if not claim:
+            return
+        yield claim, prompt("    Confidence for this inference", default="medium")
+
+
 def epistemic_fence_flow(engine, log):
     """Epistemic Fence -- required for ORANGE+."""
-    required = log.highest_risk_class in (
-        RiskClass.ORANGE, RiskClass.RED, RiskClass.BLACK
-    )
-    banner("Epistemic Fence")
-    if required:
-        print("\n  REQUIRED for " + display_risk_color(log.highest_risk_class) + " risk class.")
-    else:
-        if not prompt_yes_no(
-            "Run epistemic fence? (optional for this risk class)", default=False
-        ):
-            return
+    _load_core()
+    if not opt_in_review(
+        log, "Epistemic Fence",
+        "Run epistemic fence? (optional for this risk class)",
+    ):
+        return
 
     print("""
   Handles uncertainty, competing frames, attribution, and
@@ -1282,7 +1509,7 @@ def epistemic_fence_flow(engine, log):
   COMPRESS: One recommendation is being given.
             Requires explicit unknowns and update trigger.
 """)
-    mode_str = prompt_choice("Epistemic mode:", ["explore", "compress"])
+    mode_str = prompt_choice("Epistemic mode:", _MODE_CHOICES)
     mode = Mode.EXPLORE if mode_str == "explore" else Mode.COMPRESS
     mode_just = prompt("Why this mode?")
 
@@ -1297,13 +1524,7 @@ def epistemic_fence_flow(engine, log):
     sub_banner("6C: Reality Separation")
     facts = prompt_list("[F] Facts (directly observed or verified)")
     print("  [I] Inferences (claim + confidence level):")
-    inferences = []
-    while True:
-        claim = prompt("    Inference claim (blank to finish)", default="")
-        if not claim:
-            break
-        conf = prompt("    Confidence for this inference", default="medium")
-        inferences.append((claim, conf))
+    inferences = list(_iter_inferences())
     unknowns = prompt_list("[U] Unknowns")
     update_trigger = prompt(
         "Update trigger (what would change the recommendation)?", default=""
@@ -1398,6 +1619,7 @@ def epistemic_fence_flow(engine, log):
 
 def standalone_drift_alarm():
     """Standalone Drift Alarm Detector."""
+    _load_core()
     banner("Drift Alarm Detector")
     print("""
   Paste or type text to scan for rationalization patterns.
@@ -1419,8 +1641,7 @@ def standalone_drift_alarm():
     sub_banner("Results")
     if alarms:
         warn("Found " + str(len(alarms)) + " drift alarm(s):")
-        for a in alarms:
-            drift_alarm(a)
+        drift_alarms(alarms)
         print()
         warn("When drift alarms fire, you must explicitly name:")
         warn("  Wall (constraint), Gap (harm leak), Door (escape vector)")
@@ -1433,6 +1654,7 @@ def standalone_drift_alarm():
 
 def standalone_tone_validator():
     """Standalone Tone Validator."""
+    _load_core()
     banner("Tone Validator (Brutal Clarity + Zero Contempt)")
     print("""
   Validates text against PBHP's tone requirements.
@@ -1480,6 +1702,7 @@ def standalone_tone_validator():
 
 def standalone_compare_options():
     """Standalone Lexicographic Priority comparison."""
+    _load_core()
     banner("Compare Options (Lexicographic Priority)")
     print("""
   Compare two options using PBHP's lexicographic priority system.
@@ -1493,33 +1716,31 @@ def standalone_compare_options():
   This prevents: "We helped 10,000 by ruining 500."
 """)
 
-    def collect_harms(label):
-        sub_banner("Harms for " + label)
-        harms = []
+    def iter_harms(label):
         while True:
             desc = prompt("  Describe a harm for " + label + " (blank to finish)")
             if not desc:
-                if not harms:
-                    warn("Enter at least one harm for comparison.")
-                    continue
-                break
-            impact_str = prompt_choice("  Impact:", [
-                "trivial", "moderate", "severe", "catastrophic"
-            ])
-            likelihood_str = prompt_choice("  Likelihood:", [
-                "unlikely", "possible", "likely", "imminent"
-            ])
+                return
+            impact_str = prompt_choice("  Impact:", _IMPACT_CHOICES)
+            likelihood_str = prompt_choice("  Likelihood:", _LIKELIHOOD_CHOICES)
             irr = prompt_yes_no("  Irreversible?", default=False)
             power = prompt_yes_no("  Power asymmetry?", default=False)
-            harms.append(Harm(
+            yield Harm(
                 description=desc,
-                impact=ImpactLevel(impact_str),
-                likelihood=LikelihoodLevel(likelihood_str),
+                impact=_member(ImpactLevel, impact_str),
+                likelihood=_member(LikelihoodLevel, likelihood_str),
                 irreversible=irr,
                 power_asymmetry=power,
                 affected_parties=[],
                 least_powerful_affected="",
-            ))
+            )
+
+    def collect_harms(label):
+        sub_banner("Harms for " + label)
+        harms = list(iter_harms(label))
+        while not harms:
+            warn("Enter at least one harm for comparison.")
+            harms = list(iter_harms(label))
         return harms
 
     harms_a = collect_harms("Option A")
@@ -1544,6 +1765,169 @@ def standalone_compare_options():
 # ===================================================================
 
 
+class BufferedLogWriter:
+    """
+    Write-behind JSONL writer for assessment logs.
+
+    Records are serialized as compact JSON (one per line) into an
+    in-memory buffer and written out in a single batch once
+    FLUSH_EVERY records have accumulated, on close(), or at interpreter
+    exit. The file is opened O_APPEND and each batch goes out as one
+    os.write(), so concurrent CLI sessions appending to the same file do
+    not interleave records. Each flush ends with an fsync. Pass
+    truncate=True to replace an existing file instead (used by export).
+    """
+
+    FLUSH_EVERY = 64
+
+    def __init__(self, filepath, flush_every=None, truncate=False):
+        self.filepath = filepath
+        self.flush_every = flush_every or self.FLUSH_EVERY
+        self._buffer = []
+        flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+        if truncate:
+            flags |= os.O_TRUNC
+        self._fd = os.open(filepath, flags, 0o644)
+        atexit.register(self.close)
+
+    @staticmethod
+    def _serialize(entry):
+        """Return one JSONL line for a dict or PBHPLog."""
+        if hasattr(entry, "to_dict"):
+            entry = entry.to_dict()
+        return _load_core().compact_json(entry) + "\n"
+
+    def _write_batch(self, lines):
+        """Write a batch of JSONL lines in one syscall and fsync the file."""
+        data = memoryview("".join(lines).encode("utf-8"))
+        while data:
+            written = os.write(self._fd, data)
+            data = data[written:]
+        os.fsync(self._fd)
+
+    def append(self, entry):
+        """Buffer one record (a dict, or a PBHPLog via to_dict())."""
+        self._buffer.append(self._serialize(entry))
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """Write all buffered records and fsync the file."""
+        if self._fd is None or not self._buffer:
+            return
+        self._write_batch(self._buffer)
+        self._buffer.clear()
+
+    def close(self):
+        """Flush remaining records and close the file."""
+        if self._fd is None:
+            return
+        self.flush()
+        os.close(self._fd)
+        self._fd = None
+        atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class BackgroundLogWriter(BufferedLogWriter):
+    """
+    JSONL journal writer that persists records on a daemon thread.
+
+    append() serializes the record and queues it; the writer thread
+    drains up to FLUSH_EVERY queued records per batch, writes them in
+    one call and fsyncs, so the interactive flow never waits on disk.
+    Pass sync=True for records that must be durable before the caller
+    continues (e.g. absolute rejections).
+
+    If a write fails, the thread records the error and keeps draining
+    the queue so callers never wait on a dead consumer; append() and
+    flush() then raise OSError, and close() reports the lost records.
+    """
+
+    QUEUE_SIZE = 256
+    _STOP = None
+
+    def __init__(self, filepath, flush_every=None):
+        # Deferred: only --journal sessions need the writer thread
+        import queue
+        import threading
+
+        super().__init__(filepath, flush_every)
+        self._error = None
+        self._lost = 0
+        self._queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self._thread = threading.Thread(
+            target=self._run, name="pbhp-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _raise_if_failed(self):
+        if self._error is not None:
+            raise OSError("journal write to " + self.filepath
+                          + " failed: " + str(self._error))
+
+    def append(self, entry, sync=False):
+        """Queue one record; with sync=True, wait until it is on disk."""
+        self._raise_if_failed()
+        self._queue.put(self._serialize(entry))
+        if sync:
+            self._queue.join()
+            self._raise_if_failed()
+
+    def flush(self):
+        """Block until every queued record has been written and synced."""
+        if self._thread.is_alive():
+            self._queue.join()
+        self._raise_if_failed()
+
+    def _run(self):
+        from queue import Empty
+
+        q = self._queue
+        while True:
+            batch = [q.get()]
+            while len(batch) < self.flush_every:
+                try:
+                    batch.append(q.get_nowait())
+                except Empty:
+                    break
+            lines = [line for line in batch if line is not self._STOP]
+            try:
+                if lines and self._error is None:
+                    self._write_batch(lines)
+                else:
+                    self._lost += len(lines)
+            except Exception as e:
+                self._error = e
+                self._lost += len(lines)
+            finally:
+                for _ in batch:
+                    q.task_done()
+            if len(lines) != len(batch):
+                return
+
+    def close(self):
+        """Drain the queue, stop the writer thread and close the file."""
+        if self._fd is None:
+            return
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+        if self._error is not None:
+            error("Journal " + self.filepath + " failed: " + str(self._error))
+            error(str(self._lost) + " record(s) were not written.")
+        # Every record has been written or counted as lost; skip flush()
+        os.close(self._fd)
+        self._fd = None
+        atexit.unregister(self.close)
+
+
 def view_logs(engine):
     """View assessment logs."""
     banner("Assessment Logs")
@@ -1552,20 +1936,26 @@ def view_logs(engine):
         pause_continue()
         return
 
-    print("\n  Total assessments: " + str(len(engine.logs)) + "\n")
+    # Build the whole summary first; one write instead of ~5 per log
+    parts = ["\n  Total assessments: " + str(len(engine.logs)) + "\n\n"]
     for i, log in enumerate(engine.logs, 1):
         risk = display_risk_color(log.highest_risk_class)
-        outcome = log.decision_outcome.value.upper()
-        ts = log.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-        action = log.action_description[:60]
-        if len(log.action_description) > 60:
+        outcome = display_outcome(log.decision_outcome)
+        ts = log.timestamp.isoformat(sep=" ", timespec="seconds")
+        description = log.action_description
+        action = description[:60]
+        if len(description) > 60:
             action += "..."
-        print("  " + str(i) + ". [" + risk + "] " + outcome + " | " + ts)
-        print("     " + action)
-        print("     ID: " + log.record_id)
-        if log.drift_alarms_triggered:
-            print("     Drift alarms: " + str(len(log.drift_alarms_triggered)))
-        print()
+        parts.append(
+            "  " + str(i) + ". [" + risk + "] " + outcome + " | " + ts + "\n"
+            "     " + action + "\n"
+            "     ID: " + log.record_id + "\n"
+        )
+        alarms = log.drift_alarms_triggered
+        if alarms:
+            parts.append("     Drift alarms: " + str(len(alarms)) + "\n")
+        parts.append("\n")
+    sys.stdout.write("".join(parts))
 
     # Offer to view details
     choice = prompt(
@@ -1583,25 +1973,31 @@ def view_logs(engine):
 
 def view_log_detail(log):
     """Display detailed log information as formatted JSON."""
+    _load_core()
     sub_banner("Log Detail: " + log.record_id)
-    print(json.dumps(log.to_dict(), indent=2, ensure_ascii=False))
+    print(pretty_json(log.to_dict()))
 
 
 def export_logs(engine):
-    """Export logs to a JSON file."""
+    """Export logs to a JSON file (or JSONL, one record per line)."""
     banner("Export Logs")
     if not engine.logs:
         info("No assessments to export.")
         pause_continue()
         return
 
-    default_name = "pbhp_logs_" + datetime.now().strftime("%Y%m%d_%H%M%S") + ".json"
+    default_name = "pbhp_logs_" + _file_stamp() + ".json"
     filepath = prompt("Export file path", default=default_name)
-    if not filepath.endswith(".json"):
+    if not filepath.endswith((".json", ".jsonl")):
         filepath += ".json"
 
     try:
-        engine.export_logs(filepath)
+        if filepath.endswith(".jsonl"):
+            with BufferedLogWriter(filepath, truncate=True) as writer:
+                for log in engine.logs:
+                    writer.append(log)
+        else:
+            engine.export_logs(filepath)
         success("Logs exported to: " + filepath)
         info("Total records exported: " + str(len(engine.logs)))
     except Exception as e:
@@ -1615,10 +2011,24 @@ def export_logs(engine):
 # ===================================================================
 
 
-def full_assessment(engine):
-    """Run the complete PBHP v0.9.5 assessment walkthrough."""
-    banner("PBHP v0.9.5 Full Assessment Walkthrough", char="=")
-    print("""
+def _journal_append(journal, log, sync=False):
+    """Append a finished log to the journal, if any; report write failures."""
+    if journal is None:
+        return
+    try:
+        journal.append(log, sync=sync)
+    except OSError as e:
+        error("Could not append to journal: " + str(e))
+
+
+def full_assessment(engine, journal=None):
+    """
+    Run the complete PBHP v0.9.5 assessment walkthrough.
+    Completed assessments are appended to `journal` (a
+    BackgroundLogWriter) when one is given.
+    """
+    _load_core()
+    banner("PBHP v0.9.5 Full Assessment Walkthrough", body="""
   This will guide you through every step of the protocol.
   You can press Ctrl+C at any time to abort.
 
@@ -1667,6 +2077,7 @@ def full_assessment(engine):
     if not step_0g_absolute_rejection(engine, log):
         # Already refused -- finalize and save
         engine.logs.append(log)
+        _journal_append(journal, log, sync=True)
         sub_banner("Assessment Complete (Refused at Absolute Rejection)")
         print()
         print(engine.generate_response(log))
@@ -1706,9 +2117,7 @@ def full_assessment(engine):
     step_6_7_decision(engine, log)
 
     # ---- Consequences Checklist (optional YELLOW, required ORANGE+) ----
-    if log.highest_risk_class in (
-        RiskClass.YELLOW, RiskClass.ORANGE, RiskClass.RED, RiskClass.BLACK
-    ):
+    if log.highest_risk_class.value in _CHECKLIST_RISKS:
         consequences_checklist_flow(engine, log)
 
     # ---- Uncertainty Assessment (optional) ----
@@ -1723,19 +2132,22 @@ def full_assessment(engine):
     print()
     print(response)
 
+    _journal_append(journal, log)
+
     # ---- Save Option ----
     offer_save(log)
 
 
 def offer_save(log):
     """Offer to save a single assessment log to file."""
+    _load_core()
     print()
     if prompt_yes_no("Save this assessment to a JSON file?", default=False):
         default_name = (
             "pbhp_"
             + log.record_id[:8]
             + "_"
-            + datetime.now().strftime("%Y%m%d_%H%M%S")
+            + _file_stamp()
             + ".json"
         )
         filepath = prompt("File path", default=default_name)
@@ -1743,7 +2155,7 @@ def offer_save(log):
             filepath += ".json"
         try:
             with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(log.to_dict(), f, indent=2, ensure_ascii=False)
+                f.write(pretty_json(log.to_dict()))
             success("Assessment saved to: " + filepath)
         except Exception as e:
             error("Save failed: " + str(e))
@@ -1754,15 +2166,15 @@ def offer_save(log):
 # ===================================================================
 
 
-def show_help():
-    """Display comprehensive help information."""
-    banner("PBHP CLI Help")
-    print("""
+_HELP_RULE = "=" * 66
+
+# Help screen text, assembled once at import
+_HELP_TEXT = ("""
   Pause-Before-Harm Protocol (PBHP) v""" + VERSION + """
   Interactive Command-Line Interface
 
   MENU OPTIONS
-  """ + "=" * 66 + """
+  """ + _HELP_RULE + """
   1. Start New Assessment
      Complete guided walkthrough of all PBHP v0.9.5 protocol steps,
      from competence gate through decision and response generation.
@@ -1787,7 +2199,8 @@ def show_help():
      Browse and inspect completed assessments.
 
   7. Export Logs
-     Export all assessment logs to a JSON file.
+     Export all assessment logs to a JSON file
+     (use a .jsonl path for one compact record per line).
 
   8. Help
      This screen.
@@ -1796,7 +2209,7 @@ def show_help():
      Exit the CLI.
 
   PROTOCOL STEPS (Full Assessment)
-  """ + "=" * 66 + """
+  """ + _HELP_RULE + """
   Step 00    Protocol Understanding (competence gate)
   Step 0a    Ethical Pause (triune minds: compassion/logic/paradox)
   Step 0d    Quick Risk Check (pre-screening)
@@ -1817,7 +2230,7 @@ def show_help():
   --         Save option
 
   RISK CLASSES
-  """ + "=" * 66 + """
+  """ + _HELP_RULE + """
   GREEN    Low risk, proceed normally
   YELLOW   Moderate risk, document and monitor
   ORANGE   High risk, alternatives + red team required
@@ -1825,7 +2238,7 @@ def show_help():
   BLACK    Extreme risk, refuse or escalate only
 
   DECISION OUTCOMES
-  """ + "=" * 66 + """
+  """ + _HELP_RULE + """
   proceed           Continue as planned
   proceed_modified  Proceed with modifications
   redirect          Use a safer alternative
@@ -1834,7 +2247,7 @@ def show_help():
   escalate          Escalate to higher authority
 
   KEY CONCEPTS
-  """ + "=" * 66 + """
+  """ + _HELP_RULE + """
   Door/Wall/Gap    Identify constraints and escape vectors
   Constraint Awareness Check       Prevent surrender to perceived inevitability
   Ethical Pause    Balance compassion, logic, paradox before acting
@@ -1845,9 +2258,14 @@ def show_help():
   Lexicographic    Prevent trading catastrophic harm for aggregate good
 
   CONTACT
-  """ + "=" * 66 + """
+  """ + _HELP_RULE + """
   """ + CONTACT_EMAIL + """
 """)
+
+
+def show_help():
+    """Display comprehensive help information."""
+    banner("PBHP CLI Help", body=_HELP_TEXT)
     pause_continue()
 
 
@@ -1856,13 +2274,14 @@ def show_help():
 # ===================================================================
 
 
-def main_menu():
-    """Main interactive menu loop."""
-    engine = PBHPEngine()
+_MENU_BAR = _bar("=")
+
+# Whole main menu screen, banner included, rendered once; only the log
+# count changes between iterations
+_MENU_TEMPLATE = "\n" + _MENU_BAR + """
+  PBHP v""" + VERSION + """ - Pause-Before-Harm Protocol CLI
+""" + _MENU_BAR + """
 
-    while True:
-        banner("PBHP v" + VERSION + " - Pause-Before-Harm Protocol CLI")
-        print("""
   Contact: """ + CONTACT_EMAIL + """
 
   1. Start New Assessment (full guided walkthrough)
@@ -1870,35 +2289,55 @@ def main_menu():
   3. Drift Alarm Detector
   4. Tone Validator
   5. Compare Options (Lexicographic Priority)
-  6. View Assessment Logs (""" + str(len(engine.logs)) + """ recorded)
+  6. View Assessment Logs ({log_count} recorded)
   7. Export Logs
   8. Help
   9. Exit
-""")
+
+"""
+
+
+_MENU_EXIT = "\n" + _P_INFO + "Exiting PBHP CLI. Remember: pause before harm.\n\n"
+
+
+def main_menu(journal=None):
+    """Main interactive menu loop."""
+    # Line editing only helps a person at a terminal; piped answers skip it
+    if sys.stdin.isatty():
+        try:
+            # Imported only for its side effect: line editing and history for input()
+            __import__("readline")
+        except ImportError:
+            pass
+    # The core module and engine are loaded on the first menu action, so
+    # drawing the menu (or exiting straight away) never imports pbhp_core
+    engine = None
+    # Menu number -> handler, bound once to this session's engine/journal
+    actions = {
+        "1": lambda: full_assessment(engine, journal),
+        "2": standalone_quick_risk_check,
+        "3": standalone_drift_alarm,
+        "4": standalone_tone_validator,
+        "5": standalone_compare_options,
+        "6": lambda: view_logs(engine),
+        "7": lambda: export_logs(engine),
+        "8": show_help,
+    }
+
+    while True:
+        log_count = len(engine.logs) if engine is not None else 0
+        sys.stdout.write(_MENU_TEMPLATE.format(log_count=log_count))
 
         choice = prompt("Select an option (1-9)")
 
-        if choice == "1":
-            full_assessment(engine)
-        elif choice == "2":
-            standalone_quick_risk_check()
-        elif choice == "3":
-            standalone_drift_alarm()
-        elif choice == "4":
-            standalone_tone_validator()
-        elif choice == "5":
-            standalone_compare_options()
-        elif choice == "6":
-            view_logs(engine)
-        elif choice == "7":
-            export_logs(engine)
-        elif choice == "8":
-            show_help()
+        action = actions.get(choice)
+        if action is not None:
+            if engine is None:
+                engine = _load_core().PBHPEngine()
+            action()
         elif choice == "9":
-            print()
-            info("Exiting PBHP CLI. Remember: pause before harm.")
-            print()
-            break
+            sys.stdout.write(_MENU_EXIT)
+            return
         else:
             warn("Invalid selection. Please choose 1-9.")
 
@@ -1908,14 +2347,17 @@ def main_menu():
 # ===================================================================
 
 
-def print_cli_help():
-    """Print CLI help for --help flag and exit."""
-    print("""
+# --help text, assembled once at import
+_CLI_HELP_TEXT = ("""
 Pause-Before-Harm Protocol (PBHP) v""" + VERSION + """ - Interactive CLI
 
 Usage:
-    python pbhp_cli.py              Launch interactive menu
-    python pbhp_cli.py --help       Show this help text
+    python pbhp_cli.py                  Launch interactive menu
+    python pbhp_cli.py --journal FILE   Also append completed assessments
+                                        to FILE (JSONL)
+    python pbhp_cli.py --editor         Answer multi-question steps in
+                                        $VISUAL / $EDITOR as one form
+    python pbhp_cli.py --help           Show this help text
 
 Description:
     An interactive command-line interface for conducting PBHP v0.7
@@ -1937,32 +2379,115 @@ Menu Options:
 No external dependencies required. Uses only Python standard library.
 
 Contact: """ + CONTACT_EMAIL + """
+
 """)
 
 
+def print_cli_help():
+    """Print CLI help for --help flag and exit."""
+    sys.stdout.write(_CLI_HELP_TEXT)
+
+
 # ===================================================================
 # ENTRY POINT
 # ===================================================================
 
 
+# The block-buffered stdout wrapper, once _buffer_piped_stdout() installs it
+_piped_stdout = None
+
+
+def _buffer_piped_stdout():
+    """
+    Give stdout a 64 KiB block buffer when it is not a terminal.
+
+    Scripted runs piped to a file or another process then hand the OS a
+    few large writes instead of many small ones. input() still flushes
+    stdout before each prompt, and the buffer is flushed at exit. Safe to
+    call again: stdout is only rewrapped once per process.
+    """
+    global _piped_stdout
+    if _piped_stdout is not None:
+        return
+    try:
+        if sys.stdout.isatty():
+            return
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        return
+    sys.stdout.flush()
+    sys.stdout = os.fdopen(
+        fd, "w", buffering=1 << 16,
+        encoding=sys.stdout.encoding, errors=sys.stdout.errors,
+        closefd=False,
+    )
+    _piped_stdout = sys.stdout
+    atexit.register(_piped_stdout.flush)
+
+
+# Shown when Ctrl-C ends the session
+_INTERRUPT_TEXT = (
+    "\n\n" + _MENU_BAR + "\n"
+    "  PBHP CLI interrupted. No data was lost from completed assessments.\n"
+    "  Remember: pause before harm.\n"
+    "  Contact: " + CONTACT_EMAIL + "\n"
+    + _MENU_BAR + "\n\n"
+)
+
+
 def main():
     """Entry point for PBHP CLI."""
-    # Handle --help flag
-    if len(sys.argv) > 1 and sys.argv[1] in ("--help", "-h", "help"):
+    _buffer_piped_stdout()
+
+    args = sys.argv[1:]
+
+    # Handle --help flag, wherever it appears
+    if any(arg in ("--help", "-h", "help") for arg in args):
         print_cli_help()
         sys.exit(0)
 
+    global _form_editor
+    journal_path = None
+    use_editor = False
+    while args:
+        arg = args.pop(0)
+        if arg == "--journal":
+            if not args:
+                error("--journal requires a file path.")
+                sys.exit(2)
+            journal_path = args.pop(0)
+        elif arg.startswith("--journal="):
+            journal_path = arg[len("--journal="):]
+            if not journal_path:
+                error("--journal requires a file path.")
+                sys.exit(2)
+        elif arg == "--editor":
+            use_editor = True
+        else:
+            error("Unknown option: " + arg + " (see --help)")
+            sys.exit(2)
+
+    if use_editor:
+        _form_editor = os.environ.get("VISUAL") or os.environ.get("EDITOR")
+        if not _form_editor:
+            warn("--editor needs $VISUAL or $EDITOR; asking one question at a time.")
+
+    journal = None
+    if journal_path is not None:
+        try:
+            journal = BackgroundLogWriter(journal_path)
+        except OSError as e:
+            error("Cannot open journal file " + journal_path + ": " + e.strerror)
+            sys.exit(2)
+
     try:
-        main_menu()
+        main_menu(journal)
     except KeyboardInterrupt:
-        print("\n")
-        print("=" * BANNER_WIDTH)
-        print("  PBHP CLI interrupted. No data was lost from completed assessments.")
-        print("  Remember: pause before harm.")
-        print("  Contact: " + CONTACT_EMAIL)
-        print("=" * BANNER_WIDTH)
-        print()
+        sys.stdout.write(_INTERRUPT_TEXT)
         sys.exit(0)
+    finally:
+        if journal is not None:
+            journal.close()
 
 
 if __name__ == "__main__":
@@ -11,6 +11,7 @@ interactive prompts produce correct UX flows.
 """
 
 import unittest
+import subprocess
 import sys
 import os
 import io
@@ -18,7 +19,16 @@ from unittest.mock import patch
 from contextlib import redirect_stdout
 
 # Ensure src/ is on the path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SRC_DIR)
+
+
+def _run_snippet(code, stdin=None):
+    """Run `code` in a fresh interpreter from src/ and return the result."""
+    return subprocess.run(
+        [sys.executable, "-c", code], input=stdin,
+        capture_output=True, text=True, cwd=SRC_DIR,
+    )
 
 
 # ── CLI helper function tests ──────────────────────────────────────────
@@ -33,6 +43,65 @@ class TestCLIImports(unittest.TestCase):
         self.assertTrue(hasattr(pbhp_cli, "VERSION"))
         self.assertTrue(hasattr(pbhp_cli, "PBHPEngine"))
 
+    def test_cli_import_defers_core(self):
+        code = (
+            "import sys, pbhp_cli; "
+            "assert 'pbhp_core' not in sys.modules; "
+            "assert not {'readline', 'threading', 'queue'} & set(sys.modules); "
+            "pbhp_cli.PBHPEngine; "
+            "assert 'pbhp_core' in sys.modules"
+        )
+        result = _run_snippet(code)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_examples_import_defers_core(self):
+        code = (
+            "import sys, pbhp_examples; "
+            "assert 'pbhp_core' not in sys.modules; "
+            "pbhp_examples.RiskClass; "
+            "assert 'pbhp_core' in sys.modules"
+        )
+        result = _run_snippet(code)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_list_scenarios_defers_core(self):
+        code = (
+            "import sys, pbhp_examples; "
+            "names = [n for n, _ in pbhp_examples.list_scenarios()]; "
+            "assert names[0] == 'employee_warning', names; "
+            "assert len(names) == 5, names; "
+            "assert pbhp_examples.list_scenarios()[3][1]['risk'] == 'BLACK'; "
+            "assert 'pbhp_core' not in sys.modules"
+        )
+        result = _run_snippet(code)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_flows_load_core_themselves(self):
+        code = (
+            "import pbhp_cli, pbhp_core; "
+            "pbhp_cli.standalone_quick_risk_check(); "
+            "pbhp_cli.view_log_detail("
+            "pbhp_core.PBHPEngine().create_assessment('Send an email'))"
+        )
+        result = _run_snippet(code, stdin="1\n1\nn\nn\n\n")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("Risk Class: ", result.stdout)
+
+    def test_core_import_defers_optional_modules(self):
+        code = (
+            "import sys, pbhp_core; "
+            "assert 'orjson' not in sys.modules; "
+            "assert 'uuid' not in sys.modules; "
+            "assert 'json' not in sys.modules; "
+            "assert 'difflib' not in sys.modules; "
+            "log = pbhp_core.PBHPEngine().create_assessment('Send an email'); "
+            "assert 'uuid' in sys.modules; "
+            "log.to_json(); "
+            "assert 'json' in sys.modules"
+        )
+        result = _run_snippet(code)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
     def test_examples_module_imports(self):
         import pbhp_examples
         self.assertTrue(hasattr(pbhp_examples, "run_all_examples"))
@@ -54,6 +123,16 @@ class TestCLIHelpers(unittest.TestCase):
         self.assertIn("Test Title", output)
         self.assertIn("=" * self.cli.BANNER_WIDTH, output)
 
+    def test_banner_with_body_single_write(self):
+        from unittest.mock import MagicMock
+        fake = MagicMock()
+        with patch("sys.stdout", fake):
+            self.cli.banner("Step X", body="\n  Body text.\n")
+        self.assertEqual(fake.write.call_count, 1)
+        output = fake.write.call_args[0][0]
+        self.assertTrue(output.endswith("=" * self.cli.BANNER_WIDTH
+                                        + "\n\n  Body text.\n\n"))
+
     def test_sub_banner_prints(self):
         buf = io.StringIO()
         with redirect_stdout(buf):
@@ -88,6 +167,15 @@ class TestCLIHelpers(unittest.TestCase):
             self.cli.success("good")
         self.assertIn("[OK]", buf.getvalue()) if hasattr(self.cli, "success") else None
 
+    def test_drift_alarms_single_write(self):
+        from unittest.mock import MagicMock
+        fake = MagicMock()
+        with patch("sys.stdout", fake):
+            self.cli.drift_alarms(["first", "second"])
+        fake.write.assert_called_once_with(
+            "  [DRIFT ALARM] first\n  [DRIFT ALARM] second\n"
+        )
+
     def test_display_risk_class(self):
         from pbhp_core import RiskClass
         result = self.cli.display_risk_class(RiskClass.ORANGE)
@@ -98,6 +186,43 @@ class TestCLIHelpers(unittest.TestCase):
         result = self.cli.display_risk_class(RiskClass.GREEN)
         self.assertIn("GREEN", result)
 
+    def test_display_risk_class_all_classes_labelled(self):
+        from pbhp_core import RiskClass
+        for rc in RiskClass:
+            result = self.cli.display_risk_class(rc)
+            self.assertTrue(result.startswith(rc.value.upper()))
+            self.assertIn(" - ", result)
+
+    def test_step_3_requirements_single_block(self):
+        from pbhp_core import PBHPEngine, RiskClass
+        log = PBHPEngine().create_assessment("Send a reminder email to the team")
+        for rc in RiskClass:
+            log.highest_risk_class = rc
+            buf = io.StringIO()
+            with patch("builtins.input", return_value=""), redirect_stdout(buf):
+                self.cli.step_3_risk_display(log)
+            self.assertIn("[INFO] Requirements: ", buf.getvalue())
+
+    def test_step_3_harm_summary(self):
+        from pbhp_core import PBHPEngine, ImpactLevel, LikelihoodLevel
+        engine = PBHPEngine()
+        log = engine.create_assessment("Send a reminder email to the team")
+        engine.add_harm(log, "Team feels rushed", ImpactLevel.MODERATE,
+                        LikelihoodLevel.POSSIBLE, False, False, ["team"], "team",
+                        audience_risk_elevated=True)
+        engine.add_harm(log, "Typo embarrasses sender", ImpactLevel.TRIVIAL,
+                        LikelihoodLevel.POSSIBLE, False, False, ["sender"], "sender")
+        buf = io.StringIO()
+        with patch("builtins.input", return_value=""), redirect_stdout(buf):
+            self.cli.step_3_risk_display(log)
+        out = buf.getvalue()
+        self.assertIn(
+            "  1. [ORANGE] Team feels rushed\n"
+            "     Impact: moderate | Likelihood: possible"
+            " | Irreversible: False | Power Asymmetry: False\n"
+            "     * Audience risk elevated (risk class bumped up one level)\n"
+            "  2. [GREEN] Typo embarrasses sender\n", out)
+
     def test_display_risk_color_all_classes(self):
         from pbhp_core import RiskClass
         for rc in RiskClass:
@@ -105,6 +230,13 @@ class TestCLIHelpers(unittest.TestCase):
             self.assertIsInstance(result, str)
             self.assertTrue(len(result) > 0)
 
+    def test_display_outcome(self):
+        from pbhp_core import DecisionOutcome
+        self.assertEqual(
+            self.cli.display_outcome(DecisionOutcome.PROCEED_MODIFIED),
+            "PROCEED_MODIFIED",
+        )
+
     def test_constants(self):
         self.assertEqual(self.cli.BANNER_WIDTH, 72)
         self.assertIn("@", self.cli.CONTACT_EMAIL)
@@ -137,6 +269,110 @@ class TestCLIPromptHelpers(unittest.TestCase):
         result = self.cli.prompt_yes_no("Continue?")
         self.assertFalse(result)
 
+    @patch("builtins.input", side_effect=["maybe", "U"])
+    def test_prompt_yes_no_unsure_retries(self, mock_input):
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            result = self.cli.prompt_yes_no_unsure("Sure?")
+        self.assertIsNone(result)
+        self.assertEqual(mock_input.call_count, 2)
+
+    @patch("builtins.input", side_effect=["0", "\u00b2", "02"])
+    def test_prompt_choice_number_forms(self, mock_input):
+        with redirect_stdout(io.StringIO()):
+            result = self.cli.prompt_choice("Pick:", ("alpha", "beta", "gamma"))
+        self.assertEqual(result, "beta")
+        self.assertEqual(mock_input.call_count, 3)
+
+    @patch("builtins.input", side_effect=["7", "Beta"])
+    def test_prompt_choice_by_text(self, mock_input):
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            result = self.cli.prompt_choice("Pick one:", ["alpha", "beta"])
+        self.assertEqual(result, "beta")
+        self.assertIn("Please enter a number 1-2", buf.getvalue())
+
+    def test_prompt_list_piped_stdin(self):
+        stdin = io.StringIO("first\n  second  \n\nleftover\n")
+        buf = io.StringIO()
+        with patch("sys.stdin", stdin), redirect_stdout(buf):
+            result = self.cli.prompt_list("Items")
+        self.assertEqual(result, ["first", "second"])
+        self.assertEqual(stdin.read(), "leftover\n")
+
+    def test_prompt_list_single_line(self):
+        stdin = io.StringIO("alice; bob ;; carol\nleftover\n")
+        with patch("sys.stdin", stdin), redirect_stdout(io.StringIO()):
+            result = self.cli.prompt_list("Items", sep=";")
+        self.assertEqual(result, ["alice", "bob", "carol"])
+        self.assertEqual(stdin.read(), "leftover\n")
+
+    def test_prompt_list_sep_keeps_line_mode(self):
+        stdin = io.StringIO("alice\nbob; carol\n\n")
+        with patch("sys.stdin", stdin), redirect_stdout(io.StringIO()):
+            result = self.cli.prompt_list("Items", sep=";")
+        self.assertEqual(result, ["alice", "bob; carol"])
+
+    def test_parse_form(self):
+        text = ("# header\n\n## First?\nalpha\n  beta  \n\n"
+                "## Second?\n# a comment\n\n## Third?\ngamma\n")
+        self.assertEqual(self.cli._parse_form(text, 3), ["alpha beta", "", "gamma"])
+        self.assertIsNone(self.cli._parse_form(text, 2))
+
+    @patch("builtins.input", side_effect=["one", "two"])
+    def test_prompt_form_inline_fallback(self, mock_input):
+        with patch.object(self.cli, "_form_editor", "unused-editor"), \
+                redirect_stdout(io.StringIO()):
+            self.assertEqual(self.cli.prompt_form(("A?", "B?")), ["one", "two"])
+
+    def test_prompt_form_editor(self):
+        import shlex
+        # Stand-in editor: answer each heading with its question number
+        script = (
+            "import sys; p = sys.argv[1]; out = []; n = 0\n"
+            "for line in open(p).read().splitlines():\n"
+            "    out.append(line)\n"
+            "    if line.startswith('## '):\n"
+            "        n += 1; out.append('answer %d' % n)\n"
+            "open(p, 'w').write('\\n'.join(out))\n"
+        )
+        editor = shlex.join([sys.executable, "-c", script])
+        tty = io.StringIO()
+        tty.isatty = lambda: True
+        with patch.object(self.cli, "_form_editor", editor), \
+                patch("sys.stdin", tty), patch("builtins.input") as mock_input:
+            answers = self.cli.prompt_form(("A?", "B?", "C?"))
+        self.assertEqual(answers, ["answer 1", "answer 2", "answer 3"])
+        mock_input.assert_not_called()
+
+    def test_choice_lists_match_enums(self):
+        from pbhp_core import (
+            Mode, Confidence, ImpactLevel, LikelihoodLevel,
+            DecisionOutcome, UncertaintyLevel,
+        )
+        self.assertEqual(self.cli._IMPACT_CHOICES,
+                         tuple(i.value for i in ImpactLevel))
+        self.assertEqual(self.cli._LIKELIHOOD_CHOICES,
+                         tuple(l.value for l in LikelihoodLevel))
+        self.assertEqual(self.cli._DECISION_CHOICES,
+                         tuple(d.value for d in DecisionOutcome))
+        self.assertEqual(tuple(c[0] for c in self.cli._UNCERTAINTY_CHOICES),
+                         tuple(u.value for u in UncertaintyLevel))
+        self.assertEqual(self.cli._MODE_CHOICES, tuple(m.value for m in Mode))
+        self.assertEqual(self.cli._CONFIDENCE_CHOICES,
+                         tuple(c.value for c in Confidence))
+
+    def test_member_lookup_matches_enum_call(self):
+        from pbhp_core import ImpactLevel, DecisionOutcome
+        for choice in self.cli._IMPACT_CHOICES:
+            self.assertIs(self.cli._member(ImpactLevel, choice), ImpactLevel(choice))
+        for choice in self.cli._DECISION_CHOICES:
+            self.assertIs(self.cli._member(DecisionOutcome, choice),
+                          DecisionOutcome(choice))
+        from pbhp_core import Confidence
+        for choice in self.cli._CONFIDENCE_CHOICES:
+            self.assertIs(self.cli._member(Confidence, choice), Confidence(choice))
+
     @patch("builtins.input", return_value="1")
     def test_prompt_choice(self, mock_input):
         buf = io.StringIO()
@@ -145,6 +381,392 @@ class TestCLIPromptHelpers(unittest.TestCase):
         self.assertEqual(result, "alpha")
 
 
+class TestCLIStepRetries(unittest.TestCase):
+    """Test that step retries loop instead of recursing."""
+
+    def setUp(self):
+        import pbhp_cli
+        from pbhp_core import PBHPEngine
+        self.cli = pbhp_cli
+        self.engine = PBHPEngine()
+        self.log = self.engine.create_assessment("Send a reminder email to the team")
+
+    def test_door_wall_gap_retry_loops(self):
+        answers = ["Deadline", "Misread", "be careful", "y",
+                   "Deadline", "Misread", "Delay one day"]
+        buf = io.StringIO()
+        with patch("builtins.input", side_effect=answers), redirect_stdout(buf):
+            self.assertTrue(self.cli.step_0e_door_wall_gap(self.engine, self.log))
+        self.assertEqual(buf.getvalue().count("Step 0e:"), 1)
+        self.assertEqual(self.log.door_wall_gap.door, "Delay one day")
+        # The abandoned attempt is never committed to the log
+        alarms = [a for a in self.log.drift_alarms_triggered if "Door" in a]
+        self.assertEqual(alarms, [])
+
+    def test_door_wall_gap_retry_declined(self):
+        answers = ["w", "g", "be careful", "n"]
+        with patch("builtins.input", side_effect=answers), redirect_stdout(io.StringIO()):
+            self.assertFalse(self.cli.step_0e_door_wall_gap(self.engine, self.log))
+        self.assertEqual(self.log.door_wall_gap.door, "be careful")
+        alarms = [a for a in self.log.drift_alarms_triggered if "Door" in a]
+        self.assertEqual(len(alarms), 1)
+
+    def test_constraint_awareness_retry_loops(self):
+        answers = ["y", "y", "", "y",
+                   "y", "n", "Can choose timing"]
+        buf = io.StringIO()
+        with patch("builtins.input", side_effect=answers), \
+                patch("sys.stdin", io.StringIO("")), redirect_stdout(buf):
+            self.assertTrue(
+                self.cli.step_0f_constraint_awareness_check(self.engine, self.log)
+            )
+        self.assertEqual(buf.getvalue().count("Step 0f:"), 1)
+
+
+class TestCLIReviewGate(unittest.TestCase):
+    """Test the shared gate for optional/required review steps."""
+
+    def setUp(self):
+        import pbhp_cli
+        from pbhp_core import PBHPEngine
+        self.cli = pbhp_cli
+        self.log = PBHPEngine().create_assessment("Send a reminder email to the team")
+
+    def test_declined_review_asks_once(self):
+        from pbhp_core import RiskClass
+        self.log.highest_risk_class = RiskClass.YELLOW
+        with patch("builtins.input", return_value="n") as mock_input, \
+                redirect_stdout(io.StringIO()):
+            self.cli.step_6_5_red_team(None, self.log)
+            self.cli.consequences_checklist_flow(None, self.log)
+            self.cli.epistemic_fence_flow(None, self.log)
+        self.assertEqual(mock_input.call_count, 3)
+
+    def test_required_review_skips_question(self):
+        from pbhp_core import RiskClass
+        self.log.highest_risk_class = RiskClass.RED
+        buf = io.StringIO()
+        with patch("builtins.input") as mock_input, redirect_stdout(buf):
+            self.assertTrue(self.cli.opt_in_review(self.log, "Title", "Run it?"))
+        mock_input.assert_not_called()
+        self.assertIn("REQUIRED for RED", buf.getvalue())
+
+    def test_checklist_schema_fields(self):
+        from pbhp_core import ConsequencesChecklist
+        cc = ConsequencesChecklist()
+        entries = [e for _, qs in self.cli._CONSEQUENCES_SCHEMA for e in qs]
+        for field, kind, _ in entries:
+            self.assertTrue(hasattr(cc, field), field)
+            self.assertTrue(kind == "text" or kind in self.cli._CHECKLIST_PROMPTS)
+        self.assertEqual(len({e[0] for e in entries}), len(entries))
+
+    def test_checklist_text_runs_use_form(self):
+        from pbhp_core import PBHPEngine, RiskClass
+        self.cli._load_core()
+        self.log.highest_risk_class = RiskClass.RED
+        forms = []
+
+        def fake_form(questions):
+            forms.append(questions)
+            return ["ans"] * len(questions)
+
+        with patch.object(self.cli, "prompt_form", side_effect=fake_form), \
+                patch("builtins.input", return_value="n"), \
+                patch("sys.stdin", io.StringIO("")), redirect_stdout(io.StringIO()):
+            self.cli.consequences_checklist_flow(PBHPEngine(), self.log)
+        self.assertEqual([len(q) for q in forms], [2, 4, 3, 4])
+        self.assertEqual(forms[1][0], "Immediate harms (0-72 hours)?")
+        self.assertEqual(self.log.consequences.smallest_door, "ans")
+
+    def test_checklist_optional_early_stop(self):
+        from pbhp_core import PBHPEngine, RiskClass
+        self.cli._load_core()
+        self.log.highest_risk_class = RiskClass.YELLOW
+        answers = ["y",                     # run the optional checklist
+                   "", "", "n",             # B
+                   "", "", "", "", "n",     # C
+                   "n", "n", "n", "n",      # D (Q5-Q8)
+                   "y"]                     # stop early
+        with patch("builtins.input", side_effect=answers), \
+                patch("sys.stdin", io.StringIO("")), redirect_stdout(io.StringIO()):
+            self.cli.consequences_checklist_flow(PBHPEngine(), self.log)
+        self.assertIsNone(self.log.consequences)
+        self.assertEqual(self.log.drift_alarms_triggered, [])
+
+    def test_checklist_flags_summary(self):
+        from pbhp_core import PBHPEngine, RiskClass
+        self.cli._load_core()
+        self.log.highest_risk_class = RiskClass.RED
+        buf = io.StringIO()
+        with patch("builtins.input", return_value="y"), \
+                patch("sys.stdin", io.StringIO("")), redirect_stdout(buf):
+            self.cli.consequences_checklist_flow(PBHPEngine(), self.log)
+        out = buf.getvalue()
+        self.assertIn("  [!] irreversible_harm: FLAGGED\n", out)
+        self.assertIn("  [ ] missing_repair: clear\n", out)
+        self.assertTrue(out.endswith(
+            "\n\n  [ERROR] Critical flags in categories A/C/D require:\n"
+            "  [ERROR]   - Door/Wall/Gap re-run\n"
+            "  [ERROR]   - Constraint Awareness check re-run\n"
+            "  [ERROR]   - Safer alternative search\n"
+        ))
+
+
+class TestCLICollectors(unittest.TestCase):
+    """Test the repeated-entry collectors used by standalone flows."""
+
+    def setUp(self):
+        import pbhp_cli
+        self.cli = pbhp_cli
+        self.cli._load_core()
+
+    def test_iter_inferences(self):
+        answers = ["Costs rise", "high", "Staff leave", "", ""]
+        with patch("builtins.input", side_effect=answers), \
+                redirect_stdout(io.StringIO()):
+            pairs = list(self.cli._iter_inferences())
+        self.assertEqual(pairs, [("Costs rise", "high"), ("Staff leave", "medium")])
+
+    def test_compare_options_requires_a_harm(self):
+        answers = ["",  # Option A: blank first entry is rejected
+                   "Delay", "1", "2", "n", "n", "",
+                   "Outage", "4", "4", "y", "y", "",
+                   ""]
+        buf = io.StringIO()
+        with patch("builtins.input", side_effect=answers), redirect_stdout(buf):
+            self.cli.standalone_compare_options()
+        out = buf.getvalue()
+        self.assertEqual(out.count("Enter at least one harm"), 1)
+        self.assertIn("PREFERRED: Option A", out)
+
+
+class TestCLIMainMenu(unittest.TestCase):
+    """Test the main menu loop."""
+
+    def test_menu_renders_and_exits(self):
+        import pbhp_cli
+        buf = io.StringIO()
+        with patch("builtins.input", side_effect=["x", "9"]), redirect_stdout(buf):
+            pbhp_cli.main_menu()
+        out = buf.getvalue()
+        self.assertEqual(out.count("PBHP v" + pbhp_cli.VERSION), 2)
+        self.assertIn("Contact: " + pbhp_cli.CONTACT_EMAIL + "\n", out)
+        self.assertIn("  6. View Assessment Logs (0 recorded)\n", out)
+        self.assertIn("Invalid selection", out)
+        self.assertIn("Exiting PBHP CLI", out)
+
+    def test_piped_menu_exit_skips_core_and_readline(self):
+        code = (
+            "import sys, pbhp_cli; "
+            "pbhp_cli.main_menu(); "
+            "assert 'pbhp_core' not in sys.modules; "
+            "assert 'readline' not in sys.modules"
+        )
+        result = _run_snippet(code, stdin="9\n")
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_piped_stdout_wrapped_once(self):
+        code = (
+            "import sys, pbhp_cli; "
+            "pbhp_cli._buffer_piped_stdout(); first = sys.stdout; "
+            "pbhp_cli._buffer_piped_stdout(); "
+            "assert sys.stdout is first; "
+            "print('done')"
+        )
+        result = _run_snippet(code)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout, "done\n")
+
+    def test_interrupt_message(self):
+        import pbhp_cli
+        buf = io.StringIO()
+        with patch("sys.argv", ["pbhp_cli.py"]), \
+                patch.object(pbhp_cli, "main_menu", side_effect=KeyboardInterrupt), \
+                redirect_stdout(buf):
+            with self.assertRaises(SystemExit) as ctx:
+                pbhp_cli.main()
+        self.assertEqual(ctx.exception.code, 0)
+        bar = "=" * pbhp_cli.BANNER_WIDTH
+        self.assertEqual(buf.getvalue(), (
+            "\n\n" + bar + "\n"
+            "  PBHP CLI interrupted. No data was lost from completed assessments.\n"
+            "  Remember: pause before harm.\n"
+            "  Contact: " + pbhp_cli.CONTACT_EMAIL + "\n" + bar + "\n\n"
+        ))
+
+    def test_menu_dispatches_choice(self):
+        import pbhp_cli
+        with patch("builtins.input", side_effect=["6", "9"]), \
+                patch.object(pbhp_cli, "view_logs") as view_logs, \
+                redirect_stdout(io.StringIO()):
+            pbhp_cli.main_menu()
+        view_logs.assert_called_once()
+
+
+class TestCLIViewLogs(unittest.TestCase):
+    """Test the assessment log summary listing."""
+
+    def test_summary_lists_each_log(self):
+        import pbhp_cli
+        from pbhp_core import PBHPEngine
+        engine = PBHPEngine()
+        first = engine.create_assessment("Send a reminder email to the team")
+        log = engine.create_assessment("Publish " + "a" * 80)
+        log.drift_alarms_triggered.append("test alarm")
+        engine.logs.extend([first, log])
+        buf = io.StringIO()
+        with patch("builtins.input", return_value=""), redirect_stdout(buf):
+            pbhp_cli.view_logs(engine)
+        out = buf.getvalue()
+        self.assertIn("Total assessments: 2", out)
+        self.assertIn("  1. [", out)
+        self.assertIn("     Send a reminder email to the team\n", out)
+        self.assertIn("     Publish " + "a" * 52 + "...\n", out)
+        self.assertIn("     ID: " + log.record_id + "\n", out)
+        self.assertEqual(out.count("Drift alarms: 1"), 1)
+        ts = log.timestamp.strftime("%Y-%m-%d %H:%M:%S")
+        self.assertIn(" | " + ts + "\n", out)
+
+
+class TestBufferedLogWriter(unittest.TestCase):
+    """Test the write-behind JSONL log writer."""
+
+    def setUp(self):
+        import tempfile
+        import pbhp_cli
+        self.cli = pbhp_cli
+        fd, self.path = tempfile.mkstemp(suffix=".jsonl")
+        os.close(fd)
+
+    def tearDown(self):
+        os.unlink(self.path)
+
+    def test_records_buffered_until_flush(self):
+        writer = self.cli.BufferedLogWriter(self.path, flush_every=3)
+        writer.append({"n": 1})
+        writer.append({"n": 2})
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "")
+        writer.append({"n": 3})
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(len(f.read().splitlines()), 3)
+        writer.close()
+
+    def test_close_flushes_compact_jsonl(self):
+        import json
+        from pbhp_core import PBHPEngine
+        engine = PBHPEngine()
+        log = engine.create_assessment("Send a reminder email to the team")
+        with self.cli.BufferedLogWriter(self.path) as writer:
+            writer.append(log)
+            writer.append({"a": 1, "b": [1, 2]})
+        with open(self.path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[0])["record_id"], log.record_id)
+        self.assertEqual(lines[1], '{"a":1,"b":[1,2]}')
+
+    def test_truncate_replaces_existing_file(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write('{"old":1}\n')
+        with self.cli.BufferedLogWriter(self.path) as writer:
+            writer.append({"n": 1})
+        with self.cli.BufferedLogWriter(self.path, truncate=True) as writer:
+            writer.append({"n": 2})
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), '{"n":2}\n')
+
+    def test_export_jsonl_overwrites(self):
+        from pbhp_core import PBHPEngine
+        engine = PBHPEngine()
+        engine.logs.append(engine.create_assessment("Send a reminder email"))
+        for _ in range(2):
+            with patch("builtins.input", side_effect=[self.path, ""]), \
+                    redirect_stdout(io.StringIO()):
+                self.cli.export_logs(engine)
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(len(f.read().splitlines()), 1)
+
+    def test_background_writer_sync_append(self):
+        writer = self.cli.BackgroundLogWriter(self.path)
+        try:
+            writer.append({"n": 1}, sync=True)
+            with open(self.path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), '{"n":1}\n')
+            for n in range(2, 101):
+                writer.append({"n": n})
+        finally:
+            writer.close()
+        with open(self.path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 100)
+        self.assertEqual(lines[-1], '{"n":100}')
+        self.assertFalse(writer._thread.is_alive())
+
+    def test_background_writer_failure_does_not_hang(self):
+        writer = self.cli.BackgroundLogWriter(self.path)
+        failure = OSError(28, "No space left on device")
+        buf = io.StringIO()
+        with patch.object(writer, "_write_batch", side_effect=failure):
+            with self.assertRaises(OSError):
+                writer.append({"n": 1}, sync=True)
+            with self.assertRaises(OSError):
+                writer.append({"n": 2})
+            with self.assertRaises(OSError):
+                writer.flush()
+            with redirect_stdout(buf):
+                writer.close()
+        self.assertIn("No space left on device", buf.getvalue())
+        self.assertIn("1 record(s) were not written.", buf.getvalue())
+        self.assertFalse(writer._thread.is_alive())
+
+    def test_journal_append_reports_failure(self):
+        journal = self.cli.BackgroundLogWriter(self.path)
+        buf = io.StringIO()
+        with patch.object(journal, "_write_batch", side_effect=OSError(5, "EIO")), \
+                redirect_stdout(buf):
+            self.cli._journal_append(journal, {"n": 1}, sync=True)
+            journal.close()
+        self.assertIn("[ERROR] Could not append to journal", buf.getvalue())
+
+    def test_unopenable_journal_exits_cleanly(self):
+        missing = os.path.join(self.path + ".d", "journal.jsonl")
+        buf = io.StringIO()
+        with patch.object(sys, "argv", ["pbhp_cli.py", "--journal", missing]), \
+                redirect_stdout(buf), self.assertRaises(SystemExit) as cm:
+            self.cli.main()
+        self.assertEqual(cm.exception.code, 2)
+        self.assertIn("[ERROR] Cannot open journal file", buf.getvalue())
+
+    def test_journal_equals_form_opens_journal(self):
+        with patch.object(sys, "argv", ["pbhp_cli.py", "--journal=" + self.path]), \
+                patch.object(self.cli, "main_menu") as main_menu, \
+                redirect_stdout(io.StringIO()):
+            self.cli.main()
+        journal = main_menu.call_args.args[0]
+        self.assertIsInstance(journal, self.cli.BackgroundLogWriter)
+
+    def test_unknown_option_exits_cleanly(self):
+        buf = io.StringIO()
+        with patch.object(sys, "argv", ["pbhp_cli.py", "--jornal", self.path]), \
+                patch.object(self.cli, "main_menu") as main_menu, \
+                redirect_stdout(buf), self.assertRaises(SystemExit) as cm:
+            self.cli.main()
+        self.assertEqual(cm.exception.code, 2)
+        self.assertIn("[ERROR] Unknown option: --jornal", buf.getvalue())
+        main_menu.assert_not_called()
+
+    def test_help_after_other_options(self):
+        buf = io.StringIO()
+        with patch.object(sys, "argv", ["pbhp_cli.py", "--editor", "--help"]), \
+                patch.object(self.cli, "main_menu") as main_menu, \
+                redirect_stdout(buf), self.assertRaises(SystemExit) as cm:
+            self.cli.main()
+        self.assertEqual(cm.exception.code, 0)
+        self.assertIn("Usage:", buf.getvalue())
+        main_menu.assert_not_called()
+
+
 # ── Examples smoke tests ───────────────────────────────────────────────
 
 
@@ -276,6 +898,16 @@ class TestCLIStructure(unittest.TestCase):
         output = buf.getvalue()
         self.assertIn("PBHP", output)
 
+    def test_print_cli_help(self):
+        import pbhp_cli
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            pbhp_cli.print_cli_help()
+        out = buf.getvalue()
+        self.assertIn("(PBHP) v" + pbhp_cli.VERSION + " - Interactive CLI", out)
+        self.assertIn("--editor", out)
+        self.assertTrue(out.endswith("Contact: " + pbhp_cli.CONTACT_EMAIL + "\n\n"))
+
     def test_main_menu_callable(self):
         """main_menu should be callable (we won't actually run it)."""
         import pbhp_cli
@@ -17,11 +17,27 @@ Contact: pausebeforeharmprotocol_pbhp@protonmail.com
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Dict, Any, Tuple
-import uuid
-import json
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple, Iterable
 import re
-import difflib
+
+# Optional: faster compact log serialization. Imported on first use by
+# compact_json(), since loading orjson (uuid, zoneinfo, ...) costs more
+# than the rest of this module's imports together.
+_UNLOADED = object()
+orjson: Any = _UNLOADED
+
+
+def _load_orjson():
+    """Return the orjson module, or None if it is not installed."""
+    global orjson
+    if orjson is _UNLOADED:
+        try:
+            import orjson as module
+        except ImportError:
+            module = None
+        orjson = module
+    return orjson
 
 
 # ---------------------------------------------------------------------------
@@ -53,6 +69,16 @@ class RiskClass(Enum):
     BLACK = "black"
 
 
+# Risk class groups used for gating checks (one hash lookup per test)
+_ORANGE_PLUS = frozenset((RiskClass.ORANGE, RiskClass.RED, RiskClass.BLACK))
+_RED_PLUS = frozenset((RiskClass.RED, RiskClass.BLACK))
+_ORANGE_RED = frozenset((RiskClass.ORANGE, RiskClass.RED))
+
+# Gates from least to most severe, and each gate's position in that order
+_RISK_ORDER = tuple(RiskClass)
+_RISK_RANK = {risk: i for i, risk in enumerate(_RISK_ORDER)}
+
+
 class DecisionOutcome(Enum):
     """Final decision outcomes for PBHP assessment."""
     PROCEED = "proceed"
@@ -63,6 +89,12 @@ class DecisionOutcome(Enum):
     ESCALATE = "escalate"
 
 
+# Decision outcome groups used by the gate, requirement and response checks
+_PROCEEDING = frozenset((DecisionOutcome.PROCEED, DecisionOutcome.PROCEED_MODIFIED))
+_DOOR_OUTCOMES = _PROCEEDING | {DecisionOutcome.REDIRECT}
+_REFUSE_OR_ESCALATE = frozenset((DecisionOutcome.REFUSE, DecisionOutcome.ESCALATE))
+
+
 class Mode(Enum):
     """Epistemic mode for handling uncertainty."""
     EXPLORE = "explore"
@@ -179,12 +211,105 @@ ABSOLUTE_REJECTION_CATEGORIES = [
     "systemic dehumanization of a group",
 ]
 
+# Euphemistic patterns, each paired with a literal it cannot match without.
+# The literal is a cheap substring pre-filter so that ordinary action text
+# never reaches the regex engine.
+_EUPHEMISM_PATTERNS = tuple(
+    (pattern, literal, re.compile(pattern))
+    for pattern, literal in (
+        (r"ethnic\s+cleansing", "ethnic"),
+        (r"final\s+solution", "final"),
+        (r"master\s+race", "master"),
+        (r"racial\s+purity", "racial"),
+        (r"forced\s+labor", "forced"),
+        (r"concentration\s+camp", "concentration"),
+        (r"forced\s+sterilization", "forced"),
+        (r"eugenics.*rational", "eugenics"),
+        (r"sort.*humans.*lesser", "humans"),
+    )
+)
+
+
+# ---------------------------------------------------------------------------
+# Base Risk Classification (Step 3)
+# ---------------------------------------------------------------------------
+
+def _classify_base_risk(
+    impact: ImpactLevel,
+    likelihood: LikelihoodLevel,
+    irreversible: bool,
+    power_asymmetry: bool,
+) -> RiskClass:
+    """Core deterministic risk calculation (rules in Harm.calculate_risk_class)."""
+    # BLACK: Catastrophic + Irreversible + (Likely or Imminent)
+    if (impact == ImpactLevel.CATASTROPHIC
+            and irreversible
+            and likelihood in (LikelihoodLevel.LIKELY,
+                               LikelihoodLevel.IMMINENT)):
+        return RiskClass.BLACK
+
+    # RED conditions
+    if impact == ImpactLevel.CATASTROPHIC and irreversible:
+        return RiskClass.RED
+
+    if (impact == ImpactLevel.SEVERE
+            and irreversible
+            and likelihood in (LikelihoodLevel.LIKELY,
+                               LikelihoodLevel.IMMINENT)):
+        return RiskClass.RED
+
+    if (power_asymmetry
+            and irreversible
+            and impact in (ImpactLevel.SEVERE,
+                           ImpactLevel.CATASTROPHIC)):
+        return RiskClass.RED
+
+    # ORANGE conditions
+    if (impact == ImpactLevel.SEVERE
+            and likelihood == LikelihoodLevel.POSSIBLE):
+        return RiskClass.ORANGE
+
+    if (impact == ImpactLevel.MODERATE
+            and likelihood in (LikelihoodLevel.LIKELY,
+                               LikelihoodLevel.IMMINENT)):
+        return RiskClass.ORANGE
+
+    # Power + Irreversible always minimum ORANGE
+    if power_asymmetry and irreversible:
+        return RiskClass.ORANGE
+
+    # YELLOW conditions
+    if (impact == ImpactLevel.MODERATE
+            and likelihood == LikelihoodLevel.POSSIBLE):
+        return RiskClass.YELLOW
+
+    if (impact == ImpactLevel.TRIVIAL
+            and likelihood in (LikelihoodLevel.LIKELY,
+                               LikelihoodLevel.IMMINENT)):
+        return RiskClass.YELLOW
+
+    # GREEN (default)
+    return RiskClass.GREEN
+
+
+# All 64 (impact, likelihood, irreversible, power_asymmetry) combinations,
+# precomputed so per-harm classification is a single dict lookup.
+_BASE_RISK_TABLE = {
+    (impact, likelihood, irreversible, power): _classify_base_risk(
+        impact, likelihood, irreversible, power
+    )
+    for impact in ImpactLevel
+    for likelihood in LikelihoodLevel
+    for irreversible in (False, True)
+    for power in (False, True)
+}
+
 
 # ---------------------------------------------------------------------------
 # Data Classes
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Harm:
     """
     Represents a potential harm identified in Step 2.
@@ -203,6 +328,10 @@ class Harm:
     audience_risk_elevated: bool = False
     downstream_effect: str = ""
     reversibility_distinction: bool = False
+    # Memoized (inputs, result) of calculate_risk_class; not part of identity
+    _risk_cache: Optional[Tuple[tuple, 'RiskClass']] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def calculate_risk_class(self) -> RiskClass:
         """
@@ -220,74 +349,38 @@ class Harm:
         - YELLOW: Moderate + Possible
                   OR Trivial + (Likely or Imminent)
         - GREEN: default
+
+        The result is memoized against the fields it depends on, so
+        repeated calls are cheap and later edits to a Harm still take effect.
         """
+        inputs = (self.impact, self.likelihood, self.irreversible,
+                  self.power_asymmetry, self.audience_risk_elevated)
+        cache = self._risk_cache
+        if cache is not None and cache[0] == inputs:
+            return cache[1]
+
         risk = self._base_risk_class()
 
         # Audience risk elevation: treat one step higher
         if self.audience_risk_elevated:
             risk = self._elevate_risk_class(risk)
 
+        self._risk_cache = (inputs, risk)
         return risk
 
     def _base_risk_class(self) -> RiskClass:
-        """Core deterministic risk calculation."""
-        # BLACK: Catastrophic + Irreversible + (Likely or Imminent)
-        if (self.impact == ImpactLevel.CATASTROPHIC
-                and self.irreversible
-                and self.likelihood in (LikelihoodLevel.LIKELY,
-                                       LikelihoodLevel.IMMINENT)):
-            return RiskClass.BLACK
-
-        # RED conditions
-        if self.impact == ImpactLevel.CATASTROPHIC and self.irreversible:
-            return RiskClass.RED
-
-        if (self.impact == ImpactLevel.SEVERE
-                and self.irreversible
-                and self.likelihood in (LikelihoodLevel.LIKELY,
-                                       LikelihoodLevel.IMMINENT)):
-            return RiskClass.RED
-
-        if (self.power_asymmetry
-                and self.irreversible
-                and self.impact in (ImpactLevel.SEVERE,
-                                    ImpactLevel.CATASTROPHIC)):
-            return RiskClass.RED
-
-        # ORANGE conditions
-        if (self.impact == ImpactLevel.SEVERE
-                and self.likelihood == LikelihoodLevel.POSSIBLE):
-            return RiskClass.ORANGE
-
-        if (self.impact == ImpactLevel.MODERATE
-                and self.likelihood in (LikelihoodLevel.LIKELY,
-                                        LikelihoodLevel.IMMINENT)):
-            return RiskClass.ORANGE
-
-        # Power + Irreversible always minimum ORANGE
-        if self.power_asymmetry and self.irreversible:
-            return RiskClass.ORANGE
-
-        # YELLOW conditions
-        if (self.impact == ImpactLevel.MODERATE
-                and self.likelihood == LikelihoodLevel.POSSIBLE):
-            return RiskClass.YELLOW
-
-        if (self.impact == ImpactLevel.TRIVIAL
-                and self.likelihood in (LikelihoodLevel.LIKELY,
-                                        LikelihoodLevel.IMMINENT)):
-            return RiskClass.YELLOW
-
-        # GREEN (default)
-        return RiskClass.GREEN
+        """Core deterministic risk calculation (table lookup)."""
+        key = (self.impact, self.likelihood,
+               self.irreversible, self.power_asymmetry)
+        try:
+            return _BASE_RISK_TABLE[key]
+        except (KeyError, TypeError):
+            return _classify_base_risk(*key)
 
     @staticmethod
     def _elevate_risk_class(risk: 'RiskClass') -> 'RiskClass':
         """Elevate risk class by one step (audience risk note)."""
-        order = [RiskClass.GREEN, RiskClass.YELLOW, RiskClass.ORANGE,
-                 RiskClass.RED, RiskClass.BLACK]
-        idx = order.index(risk)
-        return order[min(idx + 1, len(order) - 1)]
+        return _RISK_ORDER[min(_RISK_RANK[risk] + 1, len(_RISK_ORDER) - 1)]
 
     def recognition_test(self) -> Tuple[bool, str]:
         """
@@ -589,19 +682,8 @@ class AbsoluteRejectionCheck:
                 self.matched_categories.append(category)
 
         # Also check for euphemistic patterns
-        euphemism_patterns = [
-            r"ethnic\s+cleansing",
-            r"final\s+solution",
-            r"master\s+race",
-            r"racial\s+purity",
-            r"forced\s+labor",
-            r"concentration\s+camp",
-            r"forced\s+sterilization",
-            r"eugenics.*rational",
-            r"sort.*humans.*lesser",
-        ]
-        for pattern in euphemism_patterns:
-            if re.search(pattern, text_lower):
+        for pattern, literal, regex in _EUPHEMISM_PATTERNS:
+            if literal in text_lower and regex.search(text_lower):
                 self.matched_categories.append(f"euphemism:{pattern}")
 
         self.triggers_rejection = len(self.matched_categories) > 0
@@ -662,7 +744,7 @@ class ConsentCheck:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsequencesChecklist:
     """
     Temporal + Cultural Impact Modeling - Consequences Checklist.
@@ -769,6 +851,21 @@ class ConsequencesChecklist:
 
         return flags
 
+    def early_sections_clear(self) -> bool:
+        """
+        True when the Q1-Q8 answers raise no flag: nothing irreversible
+        and no norm erosion. "Unsure" counts as "yes", as in
+        has_critical_flags(). Later sections are not considered.
+        """
+        if self.any_horizon_irreversible:
+            return False
+        return all(f is False for f in (
+            self.normalizes_harm,
+            self.shifts_to_ends_justify_means,
+            self.erodes_institutional_trust,
+            self.rewards_bad_behavior,
+        ))
+
     def requires_door_chim_rerun(self) -> bool:
         """
         Any yes/unsure in A (irreversible), C (agency loss),
@@ -828,7 +925,7 @@ class ConsequencesChecklist:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class EpistemicFence:
     """
     Epistemic Fence - Full implementation (Step 7, Section 6A-6G).
@@ -943,7 +1040,7 @@ class EpistemicFence:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class RedTeamReview:
     """
     Red Team Review - Adversarial Stress Test.
@@ -1048,7 +1145,7 @@ class Alternative:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class UncertaintyAssessment:
     """
     Uncertainty framework from PBHP's decision-under-uncertainty section.
@@ -1549,11 +1646,42 @@ class PBHPLog:
 
         return result
 
-    def to_json(self, indent: int = 2) -> str:
-        """Convert log to JSON string."""
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Convert log to JSON string (compact single line if indent is None)."""
+        if indent is None:
+            return compact_json(self.to_dict())
+        import json
+
         return json.dumps(self.to_dict(), indent=indent)
 
 
+@lru_cache(maxsize=32)
+def _compile_family(patterns: Tuple[str, ...]) -> Tuple[Tuple[Any, ...], Any, Tuple[bool, ...]]:
+    """
+    Compile a family of regex patterns once, keyed by the pattern strings.
+
+    Returns (members, guard, guarded). Patterns opening with \\b get no
+    literal-prefix speedup from the re engine and are slow to scan one by
+    one, so they are also joined into a single ``guard`` alternation: if
+    the guard finds nothing, none of the ``guarded`` members can match.
+    """
+    members = tuple(re.compile(p) for p in patterns)
+    guarded = tuple(p.startswith(r"\b") for p in patterns)
+    bounded = [f"(?:{p})" for p, g in zip(patterns, guarded) if g]
+    guard = re.compile("|".join(bounded)) if bounded else None
+    return members, guard, guarded
+
+
+def _family_matches(patterns: Tuple[str, ...], text: str) -> List[int]:
+    """Indices of the patterns in a family that match text, in order."""
+    members, guard, guarded = _compile_family(patterns)
+    skip_guarded = guard is not None and guard.search(text) is None
+    return [
+        i for i, regex in enumerate(members)
+        if not (skip_guarded and guarded[i]) and regex.search(text)
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Drift Alarm Detector
 # ---------------------------------------------------------------------------
@@ -1577,6 +1705,9 @@ class TextNormalizer:
         '\u201d': '"',  # right double quote
     }
 
+    _WHITESPACE_RE = re.compile(r'\s+')
+    _PUNCT_RUN_RE = re.compile(r'[.\-_]{2,}')
+
     @classmethod
     def normalize(cls, text: str) -> str:
         """Normalize text for pattern matching."""
@@ -1586,9 +1717,9 @@ class TextNormalizer:
         for char, replacement in cls.OBFUSCATION_MAP.items():
             text = text.replace(char, replacement)
         # Collapse whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = cls._WHITESPACE_RE.sub(' ', text).strip()
         # Strip repeated punctuation used to break patterns
-        text = re.sub(r'[.\-_]{2,}', ' ', text)
+        text = cls._PUNCT_RUN_RE.sub(' ', text)
         return text
 
 
@@ -1683,26 +1814,36 @@ class DriftAlarmDetector:
     @classmethod
     def _detect_regex_layer(cls, text: str, patterns, category: str) -> List[str]:
         """Layer 2: Detect patterns using regex families."""
-        detected = []
-        for pattern, name in patterns:
-            if re.search(pattern, text):
-                detected.append(f"{category}:{name}")
-        return detected
+        hits = _family_matches(tuple(p for p, _ in patterns), text)
+        return [f"{category}:{patterns[i][1]}" for i in hits]
 
     @classmethod
     def _detect_fuzzy_layer(cls, text: str) -> List[str]:
         """Layer 3: Fuzzy matching for near-miss evasion attempts."""
+        # Deferred: only this layer needs difflib
+        import difflib
+
         detected = []
+        threshold = cls.FUZZY_THRESHOLD
+        # One matcher per canonical phrase: SequenceMatcher caches its
+        # analysis of seq2, so only the chunk changes per comparison.
+        matchers = [
+            (canonical, difflib.SequenceMatcher(None, "", canonical))
+            for canonical in cls.FUZZY_CANONICAL_PHRASES
+        ]
         # Split text into sliding windows of phrase-like chunks
         words = text.split()
         for window_size in range(3, 8):
             for i in range(len(words) - window_size + 1):
                 chunk = " ".join(words[i:i + window_size])
-                for canonical in cls.FUZZY_CANONICAL_PHRASES:
-                    ratio = difflib.SequenceMatcher(
-                        None, chunk, canonical
-                    ).ratio()
-                    if ratio >= cls.FUZZY_THRESHOLD:
+                for canonical, matcher in matchers:
+                    matcher.set_seq1(chunk)
+                    # Cheap upper bounds first; ratio() only when they pass
+                    if (matcher.real_quick_ratio() < threshold
+                            or matcher.quick_ratio() < threshold):
+                        continue
+                    ratio = matcher.ratio()
+                    if ratio >= threshold:
                         detected.append(
                             f"fuzzy_drift:{canonical} "
                             f"(matched '{chunk}' at {ratio:.0%})"
@@ -1817,7 +1958,7 @@ class DriftAlarmDetector:
                 )
 
         # Check for empty/minimal justification on high-risk decisions
-        if (log.highest_risk_class in (RiskClass.ORANGE, RiskClass.RED)
+        if (log.highest_risk_class in _ORANGE_RED
                 and len(log.justification) < 50):
             alarms.append(
                 "Possible compliance theater: minimal justification for "
@@ -1883,12 +2024,9 @@ class ToneValidator:
     @classmethod
     def check_for_contempt(cls, text: str) -> List[str]:
         """Detect contemptuous language that violates PBHP tone rules."""
-        issues = []
-        text_lower = text.lower()
-        for pattern in cls.CONTEMPT_PATTERNS:
-            if re.search(pattern, text_lower):
-                issues.append(f"Contempt detected: matches '{pattern}'")
-        return issues
+        patterns = tuple(cls.CONTEMPT_PATTERNS)
+        hits = _family_matches(patterns, text.lower())
+        return [f"Contempt detected: matches '{patterns[i]}'" for i in hits]
 
     @classmethod
     def check_for_euphemism(cls, text: str) -> List[str]:
@@ -1926,6 +2064,26 @@ class LexicographicPriority:
     This prevents: "We helped 10,000 by ruining 500."
     """
 
+    @staticmethod
+    def _tally(harms: List[Harm]) -> Tuple[bool, int, int, int]:
+        """
+        Single pass over one option's harms.
+        Returns (any catastrophic+irreversible, irreversible count,
+        severe-or-worse count, power asymmetry count).
+        """
+        catastrophic = False
+        irreversible = severe = power = 0
+        for h in harms:
+            if h.irreversible:
+                irreversible += 1
+                if h.impact == ImpactLevel.CATASTROPHIC:
+                    catastrophic = True
+            if h.impact in (ImpactLevel.SEVERE, ImpactLevel.CATASTROPHIC):
+                severe += 1
+            if h.power_asymmetry:
+                power += 1
+        return catastrophic, irreversible, severe, power
+
     @staticmethod
     def compare_options(
         option_a_harms: List[Harm],
@@ -1935,49 +2093,30 @@ class LexicographicPriority:
         Compare two options using lexicographic priority.
         Returns "a", "b", or "tied".
         """
-        # Priority 1: Catastrophic irreversible harm
-        a_catastrophic = any(
-            h.impact == ImpactLevel.CATASTROPHIC and h.irreversible
-            for h in option_a_harms
-        )
-        b_catastrophic = any(
-            h.impact == ImpactLevel.CATASTROPHIC and h.irreversible
-            for h in option_b_harms
-        )
+        a_catastrophic, a_irreversible, a_severe, a_power = \
+            LexicographicPriority._tally(option_a_harms)
+        b_catastrophic, b_irreversible, b_severe, b_power = \
+            LexicographicPriority._tally(option_b_harms)
 
+        # Priority 1: Catastrophic irreversible harm
         if a_catastrophic and not b_catastrophic:
             return "b"
         if b_catastrophic and not a_catastrophic:
             return "a"
 
         # Priority 2: Minimize irreversible harm count
-        a_irreversible = sum(1 for h in option_a_harms if h.irreversible)
-        b_irreversible = sum(1 for h in option_b_harms if h.irreversible)
-
         if a_irreversible < b_irreversible:
             return "a"
         if b_irreversible < a_irreversible:
             return "b"
 
         # Priority 3: Minimize severe harm count
-        a_severe = sum(
-            1 for h in option_a_harms
-            if h.impact in (ImpactLevel.SEVERE, ImpactLevel.CATASTROPHIC)
-        )
-        b_severe = sum(
-            1 for h in option_b_harms
-            if h.impact in (ImpactLevel.SEVERE, ImpactLevel.CATASTROPHIC)
-        )
-
         if a_severe < b_severe:
             return "a"
         if b_severe < a_severe:
             return "b"
 
         # Priority 4: Power asymmetry (prefer distributing burden fairly)
-        a_power = sum(1 for h in option_a_harms if h.power_asymmetry)
-        b_power = sum(1 for h in option_b_harms if h.power_asymmetry)
-
         if a_power < b_power:
             return "a"
         if b_power < a_power:
@@ -2013,6 +2152,9 @@ class PBHPEngine:
         Create a new PBHP assessment.
         Step 1: Name the Action.
         """
+        # Deferred: uuid pulls in platform, which only record IDs need
+        import uuid
+
         log = PBHPLog(
             record_id=str(uuid.uuid4()),
             timestamp=datetime.utcnow(),
@@ -2021,26 +2163,37 @@ class PBHPEngine:
         )
         return log
 
+    # Verbs that mark a clearly stated action (substring match)
+    ACTION_VERBS = (
+        "send", "delete", "publish", "run", "execute",
+        "terminate", "remove", "modify", "create", "deploy",
+        "announce", "report", "advise", "recommend", "refuse",
+        "approve", "deny", "escalate", "provide", "restrict",
+        "release", "block", "revoke", "grant", "share",
+        "post", "write", "issue", "close", "open",
+        "rename", "update", "change", "set", "configure",
+    )
+
     def validate_action_description(self, action: str) -> Tuple[bool, str]:
         """
         Validate that action is clearly stated (Step 1).
         Truth check: Is this honest and complete enough that a
         skeptical outsider would recognize what you're doing?
         """
-        if not action or len(action.strip()) < 10:
+        if not action:
+            return False, "Action description too vague or missing"
+        return self._check_action_text(action, self.ACTION_VERBS)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _check_action_text(action: str, verbs: Tuple[str, ...]) -> Tuple[bool, str]:
+        """Pure Step 1 check, memoized so unchanged retries are free."""
+        if len(action.strip()) < 10:
             return False, "Action description too vague or missing"
 
         # Check for key verb component
-        action_verbs = [
-            "send", "delete", "publish", "run", "execute",
-            "terminate", "remove", "modify", "create", "deploy",
-            "announce", "report", "advise", "recommend", "refuse",
-            "approve", "deny", "escalate", "provide", "restrict",
-            "release", "block", "revoke", "grant", "share",
-            "post", "write", "issue", "close", "open",
-            "rename", "update", "change", "set", "configure",
-        ]
-        has_verb = any(word in action.lower() for word in action_verbs)
+        lowered = action.lower()
+        has_verb = any(word in lowered for word in verbs)
 
         if not has_verb:
             return False, "Action should include a clear verb (what you're doing)"
@@ -2273,20 +2426,31 @@ class PBHPEngine:
         log: PBHPLog,
         wall: str,
         gap: str,
-        door: str
+        door: str,
+        provisional: bool = False,
     ) -> bool:
         """
         Perform Door/Wall/Gap analysis (Step 0e).
         Returns True if a concrete Door exists.
         If no Door can be named, PBHP defaults to pause or refusal.
+
+        With provisional=True the answer is checked without touching the
+        log, so interactive retries can be evaluated before one is committed.
         """
-        log.door_wall_gap = DoorWallGap(wall=wall, gap=gap, door=door)
+        dwg = DoorWallGap(wall=wall, gap=gap, door=door)
+        if provisional:
+            return dwg.has_door()
 
-        if not log.door_wall_gap.has_door():
-            log.drift_alarms_triggered.append(
+        log.door_wall_gap = dwg
+
+        if not dwg.has_door():
+            alarm = (
                 "No concrete Door identified - PBHP does not permit "
                 "proceeding without an escape vector"
             )
+            # Retries overwrite the analysis; record the alarm only once
+            if alarm not in log.drift_alarms_triggered:
+                log.drift_alarms_triggered.append(alarm)
             return False
 
         return True
@@ -2326,14 +2490,16 @@ class PBHPEngine:
         )
 
         if log.constraint_awareness_check.requires_pause():
-            log.drift_alarms_triggered.append(
-                "Constraint Awareness check failed: no remaining choice identified"
-            )
+            alarms = ["Constraint Awareness check failed: no remaining choice identified"]
             if new_count >= 2 and len(log.constraint_awareness_check.reframes) < 2:
-                log.drift_alarms_triggered.append(
+                alarms.append(
                     "Constraint Awareness: 'no choice' claimed twice - must provide "
                     "at least 2 alternative framings"
                 )
+            # Retries overwrite the check; record each alarm only once
+            for alarm in alarms:
+                if alarm not in log.drift_alarms_triggered:
+                    log.drift_alarms_triggered.append(alarm)
             return False
 
         return True
@@ -2423,6 +2589,21 @@ class PBHPEngine:
 
         return harm
 
+    def add_harms(self, log: PBHPLog, harms: Iterable[Harm]) -> List[Harm]:
+        """
+        Add several already-built harms to the assessment (Step 2).
+        The highest risk class is updated once for the whole batch.
+        """
+        harms = list(harms)
+        log.harms.extend(harms)
+
+        top = max((_RISK_RANK[h.calculate_risk_class()] for h in harms),
+                  default=-1)
+        if top > _RISK_RANK[log.highest_risk_class]:
+            log.highest_risk_class = _RISK_ORDER[top]
+
+        return harms
+
     # ------------------------------------------------------------------
     # Step 4: Consent Check
     # ------------------------------------------------------------------
@@ -2477,6 +2658,14 @@ class PBHPEngine:
         log.alternatives.append(alt)
         return alt
 
+    def add_alternatives(
+        self, log: PBHPLog, alternatives: Iterable[Alternative]
+    ) -> List[Alternative]:
+        """Add several already-built safer alternatives (Step 5)."""
+        alternatives = list(alternatives)
+        log.alternatives.extend(alternatives)
+        return alternatives
+
     # ------------------------------------------------------------------
     # Step 6.5: Red Team Review
     # ------------------------------------------------------------------
@@ -2671,7 +2860,7 @@ class PBHPEngine:
         drift_detected = DriftAlarmDetector.detect(justification)
         if drift_detected:
             # At RED+, drift in justification INVALIDATES
-            if log.highest_risk_class in (RiskClass.RED, RiskClass.BLACK):
+            if log.highest_risk_class in _RED_PLUS:
                 gate.valid = False
                 gate.requires_rerun = True
                 gate.invalidation_reasons.append(
@@ -2686,9 +2875,7 @@ class PBHPEngine:
         theater_alarms = DriftAlarmDetector.detect_compliance_theater(log)
         if theater_alarms:
             # At ORANGE+, compliance theater INVALIDATES
-            if log.highest_risk_class in (
-                RiskClass.ORANGE, RiskClass.RED, RiskClass.BLACK
-            ):
+            if log.highest_risk_class in _ORANGE_PLUS:
                 gate.valid = False
                 gate.requires_rerun = True
                 gate.invalidation_reasons.extend(theater_alarms)
@@ -2719,10 +2906,7 @@ class PBHPEngine:
         #    unresolved validation errors
         validation_errors = self._validate_requirements(log)
         if (validation_errors
-                and log.decision_outcome in (
-                    DecisionOutcome.PROCEED,
-                    DecisionOutcome.PROCEED_MODIFIED
-                )):
+                and log.decision_outcome in _PROCEEDING):
             gate.valid = False
             gate.requires_rerun = True
             gate.invalidation_reasons.append(
@@ -2828,9 +3012,7 @@ class PBHPEngine:
 
         # 5. Door Statement
         parts.append("**5. Door Statement (Escape Vector)**")
-        if log.decision_outcome in (DecisionOutcome.PROCEED,
-                                     DecisionOutcome.PROCEED_MODIFIED,
-                                     DecisionOutcome.REDIRECT):
+        if log.decision_outcome in _DOOR_OUTCOMES:
             if log.door_wall_gap:
                 parts.append(f"Safest path: {log.door_wall_gap.door}")
             else:
@@ -2848,9 +3030,7 @@ class PBHPEngine:
 
         # 6. Epistemic Fence (if present and ORANGE+)
         if (log.epistemic_fence
-                and log.highest_risk_class in (RiskClass.ORANGE,
-                                                RiskClass.RED,
-                                                RiskClass.BLACK)):
+                and log.highest_risk_class in _ORANGE_PLUS):
             fence = log.epistemic_fence
             parts.append("**6. Epistemic Fence**")
             parts.append(f"Mode: {fence.mode.value.upper()}")
@@ -2872,8 +3052,7 @@ class PBHPEngine:
             parts.append("")
 
         # 7. Alternatives (if ORANGE+)
-        if (log.highest_risk_class in (RiskClass.ORANGE, RiskClass.RED,
-                                        RiskClass.BLACK)
+        if (log.highest_risk_class in _ORANGE_PLUS
                 and log.alternatives):
             parts.append("**7. Safer Alternatives**")
             for i, alt in enumerate(log.alternatives, 1):
@@ -2883,7 +3062,7 @@ class PBHPEngine:
             parts.append("")
 
         # 8. Transparency Note
-        if log.highest_risk_class in (RiskClass.RED, RiskClass.BLACK):
+        if log.highest_risk_class in _RED_PLUS:
             worst_harm = max(
                 log.harms,
                 key=lambda h: self._risk_class_priority(
@@ -2921,13 +3100,32 @@ class PBHPEngine:
     # Log Management
     # ------------------------------------------------------------------
 
-    def export_logs(self, filepath: str):
-        """Export all logs to JSON file."""
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(
-                [log.to_dict() for log in self.logs],
-                f, indent=2, ensure_ascii=False,
-            )
+    def export_logs(self, filepath: str, compact: bool = False):
+        """
+        Export all logs to JSON file (indented, or one line if compact).
+
+        Records are serialized one at a time into the enclosing array, so
+        only a single log's dict is held in memory at once. A 1 MiB write
+        buffer keeps those many small writes to a few system calls.
+        """
+        with open(filepath, "w", encoding="utf-8", buffering=1 << 20) as f:
+            if not self.logs:
+                f.write("[]")
+                return
+            if compact:
+                sep = "["
+                for log in self.logs:
+                    f.write(sep)
+                    f.write(compact_json(log.to_dict()))
+                    sep = ","
+                f.write("]")
+                return
+            sep = "[\n  "
+            for log in self.logs:
+                f.write(sep)
+                f.write(pretty_json(log.to_dict()).replace("\n", "\n  "))
+                sep = ",\n  "
+            f.write("\n]")
 
     def get_log_by_id(self, record_id: str) -> Optional[PBHPLog]:
         """Retrieve a log by its record ID."""
@@ -2943,13 +3141,7 @@ class PBHPEngine:
     @staticmethod
     def _risk_class_priority(risk_class: RiskClass) -> int:
         """Return numeric priority for risk class comparison."""
-        return {
-            RiskClass.GREEN: 0,
-            RiskClass.YELLOW: 1,
-            RiskClass.ORANGE: 2,
-            RiskClass.RED: 3,
-            RiskClass.BLACK: 4,
-        }[risk_class]
+        return _RISK_RANK[risk_class]
 
     def _validate_requirements(self, log: PBHPLog) -> List[str]:
         """
@@ -2965,8 +3157,7 @@ class PBHPEngine:
             errors.append("Door/Wall/Gap analysis not performed")
 
         # ORANGE+ requirements
-        if log.highest_risk_class in (RiskClass.ORANGE, RiskClass.RED,
-                                       RiskClass.BLACK):
+        if log.highest_risk_class in _ORANGE_PLUS:
             if not log.alternatives:
                 errors.append(
                     f"{log.highest_risk_class.value.upper()} requires "
@@ -2980,10 +3171,9 @@ class PBHPEngine:
 
         # RED requirements
         if log.highest_risk_class == RiskClass.RED:
-            if log.decision_outcome in (DecisionOutcome.PROCEED,
-                                         DecisionOutcome.PROCEED_MODIFIED):
+            if log.decision_outcome in _PROCEEDING:
                 if (not log.justification
-                        or "safer alternative" not in log.justification.lower()):
+                        or not mentions_safer_alternative(log.justification)):
                     errors.append(
                         "RED: Must document why safer alternatives "
                         "cannot meet the legitimate need"
@@ -2991,8 +3181,7 @@ class PBHPEngine:
 
         # BLACK requirements
         if log.highest_risk_class == RiskClass.BLACK:
-            if log.decision_outcome not in (DecisionOutcome.REFUSE,
-                                             DecisionOutcome.ESCALATE):
+            if log.decision_outcome not in _REFUSE_OR_ESCALATE:
                 errors.append(
                     "BLACK: Must refuse or escalate, cannot proceed"
                 )
@@ -3022,22 +3211,19 @@ class PBHPEngine:
         Returns:
             (final_gate, requires_escalation)
         """
-        gate_order = [RiskClass.GREEN, RiskClass.YELLOW, RiskClass.ORANGE,
-                      RiskClass.RED, RiskClass.BLACK]
-
-        idx1 = gate_order.index(gate_assessment_1)
-        idx2 = gate_order.index(gate_assessment_2)
+        idx1 = _RISK_RANK[gate_assessment_1]
+        idx2 = _RISK_RANK[gate_assessment_2]
 
         disagreement_level = abs(idx1 - idx2)
 
         if disagreement_level >= 2:
             # Escalate to higher gate on disagreement
             final_idx = max(idx1, idx2)
-            return gate_order[final_idx], True
+            return _RISK_ORDER[final_idx], True
 
         # Use the higher of the two
         final_idx = max(idx1, idx2)
-        return gate_order[final_idx], False
+        return _RISK_ORDER[final_idx], False
 
     # ------------------------------------------------------------------
     # Fix #4: GREEN Logging Floor for Power Asymmetry & Large Populations
@@ -3213,6 +3399,60 @@ def detect_drift_alarms(text: str) -> List[str]:
     return DriftAlarmDetector.detect(text)
 
 
+def _json_default(obj: Any) -> Any:
+    """Fallback encoder for compact_json: Enum -> value, datetime -> ISO."""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+def compact_json(obj: Any) -> str:
+    """
+    Serialize to compact single-line JSON for machine-readable logs.
+
+    Uses orjson when installed, otherwise the standard library with
+    minimal separators. Enums and datetimes are encoded as their value
+    and ISO string. Human-readable exports keep using indented json.dumps.
+    """
+    fast = _load_orjson()
+    if fast is not None:
+        return fast.dumps(obj, default=_json_default).decode("utf-8")
+    import json
+
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False,
+                      default=_json_default)
+
+
+def pretty_json(obj: Any) -> str:
+    """
+    Serialize to indented (2-space) JSON for human-readable output.
+
+    Uses orjson when installed, otherwise the standard library; both
+    produce the same layout and keep non-ASCII text unescaped.
+    """
+    fast = _load_orjson()
+    if fast is not None:
+        return fast.dumps(obj, default=_json_default,
+                          option=fast.OPT_INDENT_2).decode("utf-8")
+    import json
+
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default)
+
+
+_SAFER_ALT_RE = re.compile(r"safer alternative", re.IGNORECASE)
+
+
+def mentions_safer_alternative(text: str) -> bool:
+    """
+    True if a justification addresses safer alternatives (RED requirement).
+
+    Case-insensitive search without building a lowercased copy of the text.
+    """
+    return _SAFER_ALT_RE.search(text) is not None
+
+
 def compare_options(
     option_a_harms: List[Harm],
     option_b_harms: List[Harm]
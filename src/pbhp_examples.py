@@ -16,48 +16,115 @@ Usage:
         from pbhp_examples import example_employee_warning
 """
 
-import json
-
-from pbhp_core import (
-    PBHPEngine,
-    ImpactLevel,
-    LikelihoodLevel,
-    RiskClass,
-    DecisionOutcome,
-    Mode,
-    AttributionLevel,
-    ClaimType,
-    EvidenceTag,
-    UncertaintyLevel,
-    Confidence,
-    Harm,
-    DoorWallGap,
-    ConstraintAwarenessCheck,
-    EthicalPausePosture,
-    QuickRiskCheck,
-    AbsoluteRejectionCheck,
-    ConsentCheck,
-    ConsequencesChecklist,
-    EpistemicFence,
-    RedTeamReview,
-    Alternative,
-    UncertaintyAssessment,
-    FalsePositiveReview,
-    DriftAlarmDetector,
-    ToneValidator,
-    LexicographicPriority,
-    PBHPLog,
+from typing import TYPE_CHECKING
+
+# ---------------------------------------------------------------------------
+# Import from core module (deferred)
+# ---------------------------------------------------------------------------
+#
+# pbhp_core is imported the first time a scenario runs, so importing this
+# module to pick out one example (or just to inspect it) stays cheap. Each
+# example_* function calls _load_core() before using these names.
+
+_CORE_NAMES = (
+    "PBHPEngine",
+    "ImpactLevel",
+    "LikelihoodLevel",
+    "RiskClass",
+    "DecisionOutcome",
+    "Mode",
+    "AttributionLevel",
+    "ClaimType",
+    "EvidenceTag",
+    "UncertaintyLevel",
+    "Confidence",
+    "Harm",
+    "DoorWallGap",
+    "ConstraintAwarenessCheck",
+    "EthicalPausePosture",
+    "QuickRiskCheck",
+    "AbsoluteRejectionCheck",
+    "ConsentCheck",
+    "ConsequencesChecklist",
+    "EpistemicFence",
+    "RedTeamReview",
+    "Alternative",
+    "UncertaintyAssessment",
+    "FalsePositiveReview",
+    "DriftAlarmDetector",
+    "ToneValidator",
+    "LexicographicPriority",
+    "PBHPLog",
 )
 
+if TYPE_CHECKING:
+    # Same names as _CORE_NAMES, visible to linters and type checkers only
+    from pbhp_core import (
+        PBHPEngine, ImpactLevel, LikelihoodLevel, RiskClass, DecisionOutcome,
+        Mode, AttributionLevel, ClaimType, EvidenceTag, UncertaintyLevel,
+        Confidence, Harm, DoorWallGap, ConstraintAwarenessCheck,
+        EthicalPausePosture, QuickRiskCheck, AbsoluteRejectionCheck,
+        ConsentCheck, ConsequencesChecklist, EpistemicFence, RedTeamReview,
+        Alternative, UncertaintyAssessment, FalsePositiveReview,
+        DriftAlarmDetector, ToneValidator, LexicographicPriority, PBHPLog,
+    )
+
+_core = None
+
+
+def _load_core():
+    """Import pbhp_core and bind the names the scenarios use into this module."""
+    global _core
+    if _core is None:
+        import pbhp_core
+        g = globals()
+        for name in _CORE_NAMES:
+            g[name] = getattr(pbhp_core, name)
+        _core = pbhp_core
+    return _core
+
+
+def __getattr__(name):
+    if name in _CORE_NAMES:
+        _load_core()
+        return globals()[name]
+    raise AttributeError("module " + repr(__name__) + " has no attribute " + repr(name))
+
 
 SEPARATOR = "=" * 72
 SUBSEP = "-" * 60
 
 
+# Scenario registry: name -> (function, metadata), in run order. Filled in
+# by @_scenario at import, so it can be listed without loading pbhp_core.
+_SCENARIOS = {}
+
+
+def _scenario(name, title, risk):
+    """Register an example_* function under a short name."""
+    def register(fn):
+        _SCENARIOS[name] = (fn, {"title": title, "risk": risk})
+        return fn
+    return register
+
+
+def list_scenarios():
+    """Return (name, metadata) pairs for every registered scenario, in run order."""
+    return [(name, dict(meta)) for name, (_, meta) in _SCENARIOS.items()]
+
+
+def _preview(label, text, width=60):
+    """Format an indented "label: text" line, truncating long text with '...'."""
+    if len(text) > width:
+        return f"  {label}: {text[:width]}..."
+    return f"  {label}: {text}"
+
+
 # ---------------------------------------------------------------------------
 # Scenario 1: Employee Performance Warning (ORANGE)
 # ---------------------------------------------------------------------------
 
+@_scenario("employee_warning", title="Employee Performance Warning", risk="ORANGE")
 def example_employee_warning():
     """
     Scenario: A manager asks an AI system to draft a formal performance
@@ -84,6 +151,7 @@ def example_employee_warning():
     - Epistemic fence
     - Decision and response generation
     """
+    _load_core()
     print(SEPARATOR)
     print("SCENARIO 1: Employee Performance Warning (ORANGE)")
     print(SEPARATOR)
@@ -132,9 +200,9 @@ def example_employee_warning():
         ),
         high_arousal_state=False,
     )
-    print(f"  Compassion: {posture.compassion_notes[:60]}...")
-    print(f"  Logic: {posture.logic_notes[:60]}...")
-    print(f"  Paradox: {posture.paradox_notes[:60]}...")
+    print(_preview("Compassion", posture.compassion_notes))
+    print(_preview("Logic", posture.logic_notes))
+    print(_preview("Paradox", posture.paradox_notes))
 
     # ------------------------------------------------------------------
     # Step 0d: Quick Risk Check
@@ -163,7 +231,7 @@ def example_employee_warning():
              "recommend a follow-up meeting before any further action.",
     )
     print(f"  Concrete door exists: {has_door}")
-    print(f"  Door: {log.door_wall_gap.door[:70]}...")
+    print(_preview("Door", log.door_wall_gap.door, 70))
 
     # ------------------------------------------------------------------
     # Step 0f: Constraint Awareness Check
@@ -180,42 +248,41 @@ def example_employee_warning():
         ),
     )
     print(f"  Constraint Awareness passes: {chim_ok}")
-    print(f"  Remaining choice: {log.constraint_awareness_check.remaining_choice[:70]}...")
+    print(_preview("Remaining choice", log.constraint_awareness_check.remaining_choice, 70))
 
     # ------------------------------------------------------------------
     # Step 2: Identify Harms (with uncertainty levels)
     # ------------------------------------------------------------------
     print("\n[Step 2] Identify Harms")
-    harm1 = engine.add_harm(
-        log,
-        description="Formal warning enters permanent HR record, affecting "
-                    "future promotion and transfer decisions",
-        impact=ImpactLevel.MODERATE,
-        likelihood=LikelihoodLevel.LIKELY,
-        irreversible=True,
-        power_asymmetry=True,
-        affected_parties=["employee J. Rivera", "employee's dependents"],
-        least_powerful_affected="employee J. Rivera",
-        notes="Once filed, HR records are rarely expunged even if context emerges.",
-        uncertainty_level=UncertaintyLevel.SOLID,
-        evidence_basis="Three missed deadlines documented in project tracker.",
-    )
+    harm1, harm2 = engine.add_harms(log, (
+        Harm(
+            description="Formal warning enters permanent HR record, affecting "
+                        "future promotion and transfer decisions",
+            impact=ImpactLevel.MODERATE,
+            likelihood=LikelihoodLevel.LIKELY,
+            irreversible=True,
+            power_asymmetry=True,
+            affected_parties=["employee J. Rivera", "employee's dependents"],
+            least_powerful_affected="employee J. Rivera",
+            notes="Once filed, HR records are rarely expunged even if context emerges.",
+            uncertainty_level=UncertaintyLevel.SOLID,
+            evidence_basis="Three missed deadlines documented in project tracker.",
+        ),
+        Harm(
+            description="Chilling effect on team if warning is perceived as "
+                        "disproportionate or lacking context",
+            impact=ImpactLevel.MODERATE,
+            likelihood=LikelihoodLevel.POSSIBLE,
+            irreversible=False,
+            power_asymmetry=False,
+            affected_parties=["team members", "organizational culture"],
+            least_powerful_affected="junior team members",
+            notes="Other employees may avoid flagging blockers if they fear punitive response.",
+            uncertainty_level=UncertaintyLevel.FUZZY,
+            evidence_basis="Inference from general organizational behavior research.",
+        ),
+    ))
     print(f"  Harm 1 risk class: {harm1.calculate_risk_class().value.upper()}")
-
-    harm2 = engine.add_harm(
-        log,
-        description="Chilling effect on team if warning is perceived as "
-                    "disproportionate or lacking context",
-        impact=ImpactLevel.MODERATE,
-        likelihood=LikelihoodLevel.POSSIBLE,
-        irreversible=False,
-        power_asymmetry=False,
-        affected_parties=["team members", "organizational culture"],
-        least_powerful_affected="junior team members",
-        notes="Other employees may avoid flagging blockers if they fear punitive response.",
-        uncertainty_level=UncertaintyLevel.FUZZY,
-        evidence_basis="Inference from general organizational behavior research.",
-    )
     print(f"  Harm 2 risk class: {harm2.calculate_risk_class().value.upper()}")
     print(f"  Overall risk class: {log.highest_risk_class.value.upper()}")
 
@@ -296,27 +363,27 @@ def example_employee_warning():
     # Step 5: Alternatives
     # ------------------------------------------------------------------
     print("\n[Step 5] Alternatives")
-    alt1 = engine.add_alternative(
-        log,
-        description="Draft an informal coaching memo instead of a formal "
-                    "warning, documenting the pattern but not entering the "
-                    "permanent HR file",
-        preserves_goal=True,
-        reduces_harm=True,
-        reversible=True,
-        notes="Preserves accountability while leaving the employee's record clean.",
-    )
-    alt2 = engine.add_alternative(
-        log,
-        description="Recommend the manager hold a 1:1 conversation first to "
-                    "understand root causes before any written documentation",
-        preserves_goal=True,
-        reduces_harm=True,
-        reversible=True,
-        notes="Addresses the gap identified in Door/Wall/Gap analysis.",
-    )
-    for i, alt in enumerate([alt1, alt2], 1):
-        print(f"  Alt {i}: {alt.description[:65]}...")
+    alts = engine.add_alternatives(log, (
+        Alternative(
+            description="Draft an informal coaching memo instead of a formal "
+                        "warning, documenting the pattern but not entering the "
+                        "permanent HR file",
+            preserves_goal=True,
+            reduces_harm=True,
+            reversible=True,
+            notes="Preserves accountability while leaving the employee's record clean.",
+        ),
+        Alternative(
+            description="Recommend the manager hold a 1:1 conversation first to "
+                        "understand root causes before any written documentation",
+            preserves_goal=True,
+            reduces_harm=True,
+            reversible=True,
+            notes="Addresses the gap identified in Door/Wall/Gap analysis.",
+        ),
+    ))
+    for i, alt in enumerate(alts, 1):
+        print(_preview(f"Alt {i}", alt.description, 65))
 
     # ------------------------------------------------------------------
     # Step 6.5: Red Team Review (with empathy pass)
@@ -384,7 +451,7 @@ def example_employee_warning():
     red_team.issues_resolved = True
     outcome = red_team.determine_outcome()
     print(f"  Red Team outcome: {outcome}")
-    print(f"  Empathy - steelman: {red_team.steelman_other_side[:60]}...")
+    print(_preview("Empathy - steelman", red_team.steelman_other_side))
     print(f"  Off-ramps: {red_team.off_ramps_identified}")
 
     # ------------------------------------------------------------------
@@ -552,6 +619,7 @@ def example_employee_warning():
 # Scenario 2: AI Advice on Workplace Abuse (RED)
 # ---------------------------------------------------------------------------
 
+@_scenario("workplace_abuse_advice", title="AI Advice on Workplace Abuse", risk="RED")
 def example_workplace_abuse_advice():
     """
     Scenario: A user asks an AI to write a strongly-worded public
@@ -572,6 +640,7 @@ def example_workplace_abuse_advice():
     - Epistemic fence in EXPLORE mode with competing frames
     - Refusal with safer alternatives
     """
+    _load_core()
     print(SEPARATOR)
     print("SCENARIO 2: AI Advice on Workplace Abuse (RED)")
     print(SEPARATOR)
@@ -627,7 +696,7 @@ def example_workplace_abuse_advice():
         ),
     )
     print(f"  High arousal: {posture.high_arousal_state}")
-    print(f"  Arousal notes: {posture.high_arousal_notes[:70]}...")
+    print(_preview("Arousal notes", posture.high_arousal_notes, 70))
 
     # ------------------------------------------------------------------
     # Step 0d: Quick Risk Check
@@ -680,50 +749,47 @@ def example_workplace_abuse_advice():
     # ------------------------------------------------------------------
     print("\n[Step 2] Identify Harms")
 
-    harm1 = engine.add_harm(
-        log,
-        description="Irreversible reputational damage to named manager based "
-                    "on unverified one-sided account",
-        impact=ImpactLevel.SEVERE,
-        likelihood=LikelihoodLevel.LIKELY,
-        irreversible=True,
-        power_asymmetry=True,
-        affected_parties=["manager D. Chen", "manager's family", "manager's career"],
-        least_powerful_affected="manager D. Chen (in context of public accusation)",
-        notes="Once published, content is archived and indexed permanently.",
-        uncertainty_level=UncertaintyLevel.FUZZY,
-        evidence_basis="Only the user's unverified account is available.",
-    )
+    harm1, harm2, harm3 = engine.add_harms(log, (
+        Harm(
+            description="Irreversible reputational damage to named manager based "
+                        "on unverified one-sided account",
+            impact=ImpactLevel.SEVERE,
+            likelihood=LikelihoodLevel.LIKELY,
+            irreversible=True,
+            power_asymmetry=True,
+            affected_parties=["manager D. Chen", "manager's family", "manager's career"],
+            least_powerful_affected="manager D. Chen (in context of public accusation)",
+            notes="Once published, content is archived and indexed permanently.",
+            uncertainty_level=UncertaintyLevel.FUZZY,
+            evidence_basis="Only the user's unverified account is available.",
+        ),
+        Harm(
+            description="Legal liability for the user if claims are found to be "
+                        "inaccurate or defamatory",
+            impact=ImpactLevel.SEVERE,
+            likelihood=LikelihoodLevel.POSSIBLE,
+            irreversible=True,
+            power_asymmetry=True,
+            affected_parties=["user"],
+            least_powerful_affected="user (if employer retaliates or sues)",
+            uncertainty_level=UncertaintyLevel.FUZZY,
+            evidence_basis="Defamation law applies to false public statements of fact.",
+        ),
+        Harm(
+            description="If the user IS being abused, refusing all help could "
+                        "leave them without recourse and feeling dismissed",
+            impact=ImpactLevel.MODERATE,
+            likelihood=LikelihoodLevel.POSSIBLE,
+            irreversible=False,
+            power_asymmetry=True,
+            affected_parties=["user"],
+            least_powerful_affected="user (subordinate in workplace hierarchy)",
+            uncertainty_level=UncertaintyLevel.FUZZY,
+            evidence_basis="Inference from user's stated experience.",
+        ),
+    ))
     print(f"  Harm 1 (to manager): {harm1.calculate_risk_class().value.upper()}")
-
-    harm2 = engine.add_harm(
-        log,
-        description="Legal liability for the user if claims are found to be "
-                    "inaccurate or defamatory",
-        impact=ImpactLevel.SEVERE,
-        likelihood=LikelihoodLevel.POSSIBLE,
-        irreversible=True,
-        power_asymmetry=True,
-        affected_parties=["user"],
-        least_powerful_affected="user (if employer retaliates or sues)",
-        uncertainty_level=UncertaintyLevel.FUZZY,
-        evidence_basis="Defamation law applies to false public statements of fact.",
-    )
     print(f"  Harm 2 (to user): {harm2.calculate_risk_class().value.upper()}")
-
-    harm3 = engine.add_harm(
-        log,
-        description="If the user IS being abused, refusing all help could "
-                    "leave them without recourse and feeling dismissed",
-        impact=ImpactLevel.MODERATE,
-        likelihood=LikelihoodLevel.POSSIBLE,
-        irreversible=False,
-        power_asymmetry=True,
-        affected_parties=["user"],
-        least_powerful_affected="user (subordinate in workplace hierarchy)",
-        uncertainty_level=UncertaintyLevel.FUZZY,
-        evidence_basis="Inference from user's stated experience.",
-    )
     print(f"  Harm 3 (inaction harm): {harm3.calculate_risk_class().value.upper()}")
 
     print(f"  Overall risk class: {log.highest_risk_class.value.upper()}")
@@ -750,35 +816,34 @@ def example_workplace_abuse_advice():
     # Step 5: Alternatives (safer paths)
     # ------------------------------------------------------------------
     print("\n[Step 5] Alternatives")
-    alt1 = engine.add_alternative(
-        log,
-        description="Help the user write a detailed private incident log with "
-                    "dates, witnesses, and specifics for use with HR or legal counsel",
-        preserves_goal=True,
-        reduces_harm=True,
-        reversible=True,
-        notes="Documents the experience without irreversible public harm.",
-    )
-    alt2 = engine.add_alternative(
-        log,
-        description="Provide information about workplace abuse reporting channels: "
-                    "HR hotline, EEOC, labor board, employment attorney consultation",
-        preserves_goal=True,
-        reduces_harm=True,
-        reversible=True,
-        notes="Empowers the user with actionable options that include due process.",
-    )
-    alt3 = engine.add_alternative(
-        log,
-        description="Help draft a formal internal complaint to HR that names "
-                    "specific incidents without public exposure",
-        preserves_goal=True,
-        reduces_harm=True,
-        reversible=True,
-        notes="Uses proper institutional channels while preserving documentation.",
-    )
-    for i, alt in enumerate([alt1, alt2, alt3], 1):
-        print(f"  Alt {i}: {alt.description[:65]}...")
+    alts = engine.add_alternatives(log, (
+        Alternative(
+            description="Help the user write a detailed private incident log with "
+                        "dates, witnesses, and specifics for use with HR or legal counsel",
+            preserves_goal=True,
+            reduces_harm=True,
+            reversible=True,
+            notes="Documents the experience without irreversible public harm.",
+        ),
+        Alternative(
+            description="Provide information about workplace abuse reporting channels: "
+                        "HR hotline, EEOC, labor board, employment attorney consultation",
+            preserves_goal=True,
+            reduces_harm=True,
+            reversible=True,
+            notes="Empowers the user with actionable options that include due process.",
+        ),
+        Alternative(
+            description="Help draft a formal internal complaint to HR that names "
+                        "specific incidents without public exposure",
+            preserves_goal=True,
+            reduces_harm=True,
+            reversible=True,
+            notes="Uses proper institutional channels while preserving documentation.",
+        ),
+    ))
+    for i, alt in enumerate(alts, 1):
+        print(_preview(f"Alt {i}", alt.description, 65))
 
     # ------------------------------------------------------------------
     # Step 6.5: Red Team Review (full, with claim tags)
@@ -854,7 +919,7 @@ def example_workplace_abuse_advice():
     red_team.issues_resolved = False
     outcome = red_team.determine_outcome()
     print(f"  Red Team outcome: {outcome}")
-    print(f"  Claim tags: {red_team.claim_tags[:70]}...")
+    print(_preview("Claim tags", red_team.claim_tags, 70))
 
     # ------------------------------------------------------------------
     # Step 7: Epistemic Fence (EXPLORE mode with competing frames)
@@ -983,6 +1048,7 @@ def example_workplace_abuse_advice():
 # Scenario 3: Renaming a File (GREEN)
 # ---------------------------------------------------------------------------
 
+@_scenario("rename_file", title="Renaming a File", risk="GREEN")
 def example_rename_file():
     """
     Scenario: User asks to rename a file from 'report_draft.txt' to
@@ -996,6 +1062,7 @@ def example_rename_file():
     - Minimal harms
     - GREEN classification fast path
     """
+    _load_core()
     print(SEPARATOR)
     print("SCENARIO 3: Renaming a File (GREEN)")
     print(SEPARATOR)
@@ -1093,6 +1160,7 @@ def example_rename_file():
 # Scenario 4: Public Accusation Post (BLACK)
 # ---------------------------------------------------------------------------
 
+@_scenario("public_accusation_post", title="Public Accusation Post", risk="BLACK")
 def example_public_accusation_post():
     """
     Scenario: User asks the AI to write and publish a post accusing a
@@ -1114,6 +1182,7 @@ def example_public_accusation_post():
     - BLACK classification with mandatory refuse
     - Transparency note
     """
+    _load_core()
     print(SEPARATOR)
     print("SCENARIO 4: Public Accusation Post (BLACK)")
     print(SEPARATOR)
@@ -1209,57 +1278,54 @@ def example_public_accusation_post():
     # ------------------------------------------------------------------
     print("\n[Step 2] Identify Harms")
 
-    harm1 = engine.add_harm(
-        log,
-        description="Catastrophic reputational destruction of named public "
-                    "figure based on fabricated criminal accusation",
-        impact=ImpactLevel.CATASTROPHIC,
-        likelihood=LikelihoodLevel.IMMINENT,
-        irreversible=True,
-        power_asymmetry=True,
-        affected_parties=["target M. Torres", "target's family",
-                          "target's professional network"],
-        least_powerful_affected="target M. Torres (no ability to preempt "
-                                "fabricated content)",
-        uncertainty_level=UncertaintyLevel.SOLID,
-        evidence_basis="User explicitly states content is fabricated and "
-                       "intended to destroy the target.",
-        audience_risk_elevated=True,
-    )
+    harm1, harm2, harm3 = engine.add_harms(log, (
+        Harm(
+            description="Catastrophic reputational destruction of named public "
+                        "figure based on fabricated criminal accusation",
+            impact=ImpactLevel.CATASTROPHIC,
+            likelihood=LikelihoodLevel.IMMINENT,
+            irreversible=True,
+            power_asymmetry=True,
+            affected_parties=["target M. Torres", "target's family",
+                              "target's professional network"],
+            least_powerful_affected="target M. Torres (no ability to preempt "
+                                    "fabricated content)",
+            uncertainty_level=UncertaintyLevel.SOLID,
+            evidence_basis="User explicitly states content is fabricated and "
+                           "intended to destroy the target.",
+            audience_risk_elevated=True,
+        ),
+        Harm(
+            description="Erosion of credibility for real sexual assault survivors "
+                        "when fabricated accounts are discovered",
+            impact=ImpactLevel.SEVERE,
+            likelihood=LikelihoodLevel.LIKELY,
+            irreversible=True,
+            power_asymmetry=True,
+            affected_parties=["sexual assault survivors", "public trust in "
+                              "survivor accounts"],
+            least_powerful_affected="sexual assault survivors",
+            uncertainty_level=UncertaintyLevel.SOLID,
+            evidence_basis="Documented pattern: fabricated accusations erode "
+                           "public trust in genuine reports.",
+            audience_risk_elevated=True,
+        ),
+        Harm(
+            description="Legal liability for the user (defamation, fraud, "
+                        "potentially criminal charges)",
+            impact=ImpactLevel.CATASTROPHIC,
+            likelihood=LikelihoodLevel.LIKELY,
+            irreversible=True,
+            power_asymmetry=False,
+            affected_parties=["user"],
+            least_powerful_affected="user",
+            uncertainty_level=UncertaintyLevel.SOLID,
+            evidence_basis="Fabricating criminal accusations is legally actionable "
+                           "in virtually all jurisdictions.",
+        ),
+    ))
     print(f"  Harm 1: {harm1.calculate_risk_class().value.upper()}")
-
-    harm2 = engine.add_harm(
-        log,
-        description="Erosion of credibility for real sexual assault survivors "
-                    "when fabricated accounts are discovered",
-        impact=ImpactLevel.SEVERE,
-        likelihood=LikelihoodLevel.LIKELY,
-        irreversible=True,
-        power_asymmetry=True,
-        affected_parties=["sexual assault survivors", "public trust in "
-                          "survivor accounts"],
-        least_powerful_affected="sexual assault survivors",
-        uncertainty_level=UncertaintyLevel.SOLID,
-        evidence_basis="Documented pattern: fabricated accusations erode "
-                       "public trust in genuine reports.",
-        audience_risk_elevated=True,
-    )
     print(f"  Harm 2: {harm2.calculate_risk_class().value.upper()}")
-
-    harm3 = engine.add_harm(
-        log,
-        description="Legal liability for the user (defamation, fraud, "
-                    "potentially criminal charges)",
-        impact=ImpactLevel.CATASTROPHIC,
-        likelihood=LikelihoodLevel.LIKELY,
-        irreversible=True,
-        power_asymmetry=False,
-        affected_parties=["user"],
-        least_powerful_affected="user",
-        uncertainty_level=UncertaintyLevel.SOLID,
-        evidence_basis="Fabricating criminal accusations is legally actionable "
-                       "in virtually all jurisdictions.",
-    )
     print(f"  Harm 3: {harm3.calculate_risk_class().value.upper()}")
 
     print(f"  Overall risk class: {log.highest_risk_class.value.upper()}")
@@ -1335,7 +1401,7 @@ def example_public_accusation_post():
         notes="The stated goal is itself harmful; alternatives redirect "
               "toward legitimate recourse only.",
     )
-    print(f"  Alt 1: {alt1.description[:65]}...")
+    print(_preview("Alt 1", alt1.description, 65))
 
     # ------------------------------------------------------------------
     # Step 6.5: Red Team Review
@@ -1437,6 +1503,7 @@ def example_public_accusation_post():
 # Scenario 5: Policy Analysis with Competing Frames (ORANGE)
 # ---------------------------------------------------------------------------
 
+@_scenario("policy_analysis", title="Policy Analysis - Competing Frames", risk="ORANGE")
 def example_policy_analysis():
     """
     Scenario: A policy researcher asks the AI to analyze a proposed
@@ -1458,6 +1525,7 @@ def example_policy_analysis():
     - Lexicographic priority comparison
     - Tone validation
     """
+    _load_core()
     print(SEPARATOR)
     print("SCENARIO 5: Policy Analysis with Competing Frames (ORANGE)")
     print(SEPARATOR)
@@ -1554,38 +1622,37 @@ def example_policy_analysis():
     # ------------------------------------------------------------------
     print("\n[Step 2] Identify Harms")
 
-    harm1 = engine.add_harm(
-        log,
-        description="Analysis could be used to justify policy that "
-                    "displaces low-income tenants if it underweights "
-                    "displacement risk",
-        impact=ImpactLevel.SEVERE,
-        likelihood=LikelihoodLevel.POSSIBLE,
-        irreversible=False,
-        power_asymmetry=True,
-        affected_parties=["low-income tenants", "elderly renters",
-                          "families with children"],
-        least_powerful_affected="low-income tenants facing displacement",
-        uncertainty_level=UncertaintyLevel.FUZZY,
-        evidence_basis="Empirical studies show mixed results on rent control "
-                       "and displacement.",
-    )
+    harm1, harm2 = engine.add_harms(log, (
+        Harm(
+            description="Analysis could be used to justify policy that "
+                        "displaces low-income tenants if it underweights "
+                        "displacement risk",
+            impact=ImpactLevel.SEVERE,
+            likelihood=LikelihoodLevel.POSSIBLE,
+            irreversible=False,
+            power_asymmetry=True,
+            affected_parties=["low-income tenants", "elderly renters",
+                              "families with children"],
+            least_powerful_affected="low-income tenants facing displacement",
+            uncertainty_level=UncertaintyLevel.FUZZY,
+            evidence_basis="Empirical studies show mixed results on rent control "
+                           "and displacement.",
+        ),
+        Harm(
+            description="Analysis could lead to policy that reduces housing "
+                        "supply if it underweights supply-side effects",
+            impact=ImpactLevel.MODERATE,
+            likelihood=LikelihoodLevel.POSSIBLE,
+            irreversible=False,
+            power_asymmetry=False,
+            affected_parties=["future renters", "housing market participants"],
+            least_powerful_affected="future renters who cannot find housing",
+            uncertainty_level=UncertaintyLevel.FUZZY,
+            evidence_basis="Some studies show rent control reduces new construction; "
+                           "others show minimal effect depending on policy design.",
+        ),
+    ))
     print(f"  Harm 1: {harm1.calculate_risk_class().value.upper()}")
-
-    harm2 = engine.add_harm(
-        log,
-        description="Analysis could lead to policy that reduces housing "
-                    "supply if it underweights supply-side effects",
-        impact=ImpactLevel.MODERATE,
-        likelihood=LikelihoodLevel.POSSIBLE,
-        irreversible=False,
-        power_asymmetry=False,
-        affected_parties=["future renters", "housing market participants"],
-        least_powerful_affected="future renters who cannot find housing",
-        uncertainty_level=UncertaintyLevel.FUZZY,
-        evidence_basis="Some studies show rent control reduces new construction; "
-                       "others show minimal effect depending on policy design.",
-    )
     print(f"  Harm 2: {harm2.calculate_risk_class().value.upper()}")
 
     print(f"  Overall risk class: {log.highest_risk_class.value.upper()}")
@@ -1655,26 +1722,26 @@ def example_policy_analysis():
     # Step 5: Alternatives
     # ------------------------------------------------------------------
     print("\n[Step 5] Alternatives")
-    alt1 = engine.add_alternative(
-        log,
-        description="Present analysis with explicit EXPLORE-mode epistemic "
-                    "fence: competing frames, falsifiers, and clear "
-                    "identification of who bears risk under each scenario",
-        preserves_goal=True,
-        reduces_harm=True,
-        reversible=True,
-        notes="This IS the recommended approach.",
-    )
-    alt2 = engine.add_alternative(
-        log,
-        description="Include a 'what we do not know' section that explicitly "
-                    "names the uncertainties decision-makers should track",
-        preserves_goal=True,
-        reduces_harm=True,
-        reversible=True,
-    )
-    for i, alt in enumerate([alt1, alt2], 1):
-        print(f"  Alt {i}: {alt.description[:65]}...")
+    alts = engine.add_alternatives(log, (
+        Alternative(
+            description="Present analysis with explicit EXPLORE-mode epistemic "
+                        "fence: competing frames, falsifiers, and clear "
+                        "identification of who bears risk under each scenario",
+            preserves_goal=True,
+            reduces_harm=True,
+            reversible=True,
+            notes="This IS the recommended approach.",
+        ),
+        Alternative(
+            description="Include a 'what we do not know' section that explicitly "
+                        "names the uncertainties decision-makers should track",
+            preserves_goal=True,
+            reduces_harm=True,
+            reversible=True,
+        ),
+    ))
+    for i, alt in enumerate(alts, 1):
+        print(_preview(f"Alt {i}", alt.description, 65))
 
     # ------------------------------------------------------------------
     # Step 6.5: Red Team Review
@@ -1991,40 +2058,17 @@ def run_all_examples():
     print()
 
     logs = []
-
-    # --- Scenario 1: Employee Performance Warning (ORANGE) ---
-    log1 = example_employee_warning()
-    logs.append(log1)
-
-    # Print JSON log for the first scenario to demonstrate serialization
-    print(f"\n{SUBSEP}")
-    print("LOG JSON (Scenario 1 - serialization demonstration):")
-    print(SUBSEP)
-    print(log1.to_json(indent=2))
-
-    input("\n>>> Press Enter to continue to Scenario 2...\n")
-
-    # --- Scenario 2: Workplace Abuse Advice (RED) ---
-    log2 = example_workplace_abuse_advice()
-    logs.append(log2)
-
-    input("\n>>> Press Enter to continue to Scenario 3...\n")
-
-    # --- Scenario 3: Renaming a File (GREEN) ---
-    log3 = example_rename_file()
-    logs.append(log3)
-
-    input("\n>>> Press Enter to continue to Scenario 4...\n")
-
-    # --- Scenario 4: Public Accusation Post (BLACK) ---
-    log4 = example_public_accusation_post()
-    logs.append(log4)
-
-    input("\n>>> Press Enter to continue to Scenario 5...\n")
-
-    # --- Scenario 5: Policy Analysis (ORANGE - Competing Frames) ---
-    log5 = example_policy_analysis()
-    logs.append(log5)
+    for i, (fn, _) in enumerate(_SCENARIOS.values(), 1):
+        if i > 1:
+            input(f"\n>>> Press Enter to continue to Scenario {i}...\n")
+        logs.append(fn())
+
+        if i == 1:
+            # Print JSON log for the first scenario to demonstrate serialization
+            print(f"\n{SUBSEP}")
+            print("LOG JSON (Scenario 1 - serialization demonstration):")
+            print(SUBSEP)
+            print(logs[0].to_json(indent=2))
 
     # --- Summary ---
     print(f"\n{'=' * 72}")
@@ -2034,11 +2078,7 @@ def run_all_examples():
     print("-" * 95)
 
     scenario_names = [
-        "1. Employee Performance Warning",
-        "2. AI Advice on Workplace Abuse",
-        "3. Renaming a File",
-        "4. Public Accusation Post",
-        "5. Policy Analysis - Competing Frames",
+        f"{i}. {meta['title']}" for i, (_, meta) in enumerate(_SCENARIOS.values(), 1)
     ]
 
     for name, log in zip(scenario_names, logs):
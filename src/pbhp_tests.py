@@ -62,6 +62,7 @@ from pbhp_core import (
     quick_harm_check,
     detect_drift_alarms,
     compare_options,
+    mentions_safer_alternative,
 )
 
 
@@ -727,6 +728,11 @@ def test_absolute_rejection():
     arc7 = AbsoluteRejectionCheck(action_description="advocate master race ideology")
     assert_true("ARC detects 'master race'", arc7.evaluate("advocate master race ideology"))
 
+    # Euphemism with wildcard gaps
+    arc_sort = AbsoluteRejectionCheck(action_description="sort Humans into lesser tiers")
+    assert_true("ARC detects 'sort ... humans ... lesser'", arc_sort.evaluate("sort Humans into lesser tiers"))
+    assert_in("ARC euphemism label", r"euphemism:sort.*humans.*lesser", arc_sort.matched_categories)
+
     # Clean text: should not trigger
     arc_clean = AbsoluteRejectionCheck(action_description="rename a file")
     assert_false("ARC clean text no trigger", arc_clean.evaluate("rename a file"))
@@ -815,6 +821,7 @@ def test_consequences_checklist():
     assert_false("CC clean: no irreversible", flags["irreversible_harm"])
     # agency_loss: reduces_exit_appeal_optout is None, so True
     assert_true("CC clean: agency_loss (None counts as yes)", flags["agency_loss"])
+    assert_false("CC uses slots (no per-instance dict)", hasattr(cc_clean, "__dict__"))
 
     # Set explicit falses to clear flags
     cc_explicit = ConsequencesChecklist(
@@ -839,6 +846,8 @@ def test_consequences_checklist():
     assert_false("CC explicit: no honesty_concern", flags2["honesty_concern"])
     assert_false("CC explicit: no missing_repair", flags2["missing_repair"])
     assert_false("CC explicit: no door/chim rerun", cc_explicit.requires_door_chim_rerun())
+    assert_true("CC explicit: early sections clear", cc_explicit.early_sections_clear())
+    assert_false("CC clean: unsure Q5-Q8 not early-clear", cc_clean.early_sections_clear())
 
     # Irreversible + agency loss -> requires door/chim rerun
     cc_critical = ConsequencesChecklist(
@@ -846,6 +855,7 @@ def test_consequences_checklist():
         reduces_exit_appeal_optout=True,
     )
     assert_true("CC critical: requires door/chim rerun", cc_critical.requires_door_chim_rerun())
+    assert_false("CC critical: early sections not clear", cc_critical.early_sections_clear())
 
     # Abuse/drift flagged
     cc_abuse = ConsequencesChecklist(
@@ -1420,6 +1430,19 @@ def test_engine_validate_action():
     valid4, _ = engine.validate_action_description("")
     assert_false("Validate empty", valid4)
 
+    # Repeat validations are served from the cache
+    PBHPEngine._check_action_text.cache_clear()
+    engine.validate_action_description("Send warning email to team member")
+    engine.validate_action_description("Send warning email to team member")
+    info = PBHPEngine._check_action_text.cache_info()
+    assert_eq("Validate cache hit on retry", info.hits, 1)
+
+    # Subclass verb lists are part of the cache key
+    class StrictEngine(PBHPEngine):
+        ACTION_VERBS = ("terminate",)
+    valid5, _ = StrictEngine().validate_action_description("Send warning email to team member")
+    assert_false("Validate honours subclass verbs", valid5)
+
 
 def test_engine_ethical_pause():
     print("\n--- Engine: Ethical Pause ---")
@@ -1489,6 +1512,18 @@ def test_engine_door_wall_gap():
     found = any("no concrete door" in a.lower() for a in log2.drift_alarms_triggered)
     assert_true("DWG vague door alarm", found)
 
+    # Retrying on the same log does not duplicate the alarm
+    engine.perform_door_wall_gap(log2, wall="wall", gap="gap", door="be careful")
+    count = sum("no concrete door" in a.lower() for a in log2.drift_alarms_triggered)
+    assert_eq("DWG retry alarm recorded once", count, 1)
+
+    # Provisional checks leave the log untouched
+    log3 = engine.create_assessment("Send email", "ai_system")
+    ok = engine.perform_door_wall_gap(log3, "w", "g", "be careful", provisional=True)
+    assert_false("DWG provisional vague door False", ok)
+    assert_true("DWG provisional leaves log unset", log3.door_wall_gap is None)
+    assert_len("DWG provisional no alarm", log3.drift_alarms_triggered, 0)
+
 
 def test_engine_constraint_awareness_check():
     print("\n--- Engine: Constraint Awareness Check ---")
@@ -1578,6 +1613,51 @@ def test_engine_add_harm():
     assert_eq("Highest risk escalated to RED", log.highest_risk_class, RiskClass.RED)
 
 
+def test_engine_add_harms():
+    print("\n--- Engine: Add Harms (batch) ---")
+
+    engine = PBHPEngine()
+    log = engine.create_assessment("Deploy new policy", "ai_system")
+    harms = [
+        Harm(
+            description="Financial impact on workers",
+            impact=ImpactLevel.MODERATE,
+            likelihood=LikelihoodLevel.POSSIBLE,
+            irreversible=False,
+            power_asymmetry=True,
+            affected_parties=["workers"],
+            least_powerful_affected="workers",
+        ),
+        Harm(
+            description="Job losses",
+            impact=ImpactLevel.SEVERE,
+            likelihood=LikelihoodLevel.LIKELY,
+            irreversible=True,
+            power_asymmetry=True,
+            affected_parties=["workers"],
+            least_powerful_affected="workers",
+        ),
+    ]
+    added = engine.add_harms(log, iter(harms))
+    assert_eq("Batch returns the harms", added, harms)
+    assert_len("Two harms added", log.harms, 2)
+    assert_eq("Batch highest risk RED", log.highest_risk_class, RiskClass.RED)
+
+    # Matches adding the same harms one at a time
+    single = engine.create_assessment("Deploy new policy", "ai_system")
+    for h in harms:
+        engine.add_harm(single, **{f: getattr(h, f) for f in (
+            "description", "impact", "likelihood", "irreversible",
+            "power_asymmetry", "affected_parties", "least_powerful_affected")})
+    assert_eq("Batch matches add_harm", log.highest_risk_class, single.highest_risk_class)
+
+    # A lower-risk batch never lowers the class; an empty batch is a no-op
+    engine.add_harms(log, harms[:1])
+    engine.add_harms(log, [])
+    assert_eq("Risk class not lowered", log.highest_risk_class, RiskClass.RED)
+    assert_len("Empty batch adds nothing", log.harms, 3)
+
+
 def test_engine_consent_check():
     print("\n--- Engine: Consent Check ---")
 
@@ -1613,6 +1693,15 @@ def test_engine_alternatives():
     assert_len("One alternative added", log.alternatives, 1)
     assert_true("Alt preserves goal", alt.preserves_goal)
 
+    batch = (
+        Alternative("Send to opted-in users only", True, True, True),
+        Alternative("Delay until review", False, True, True),
+    )
+    added = engine.add_alternatives(log, iter(batch))
+    assert_eq("Batch returns the alternatives", added, list(batch))
+    assert_len("Three alternatives after batch", log.alternatives, 3)
+    assert_eq("Batch keeps order", log.alternatives[1], batch[0])
+
 
 def test_engine_red_team_review():
     print("\n--- Engine: Red Team Review ---")
@@ -2037,10 +2126,96 @@ def test_log_export():
         assert_true("Export is list", isinstance(data, list))
         assert_len("Export has one log", data, 1)
         assert_eq("Export record matches", data[0]["record_id"], log.record_id)
+
+        # Streamed layout matches json.dump(indent=2), with or without orjson
+        import pbhp_core
+        engine.logs.append(engine.create_assessment("Second export \u00e9", "ai_system"))
+        expected = json.dumps([l.to_dict() for l in engine.logs],
+                              indent=2, ensure_ascii=False)
+        saved = pbhp_core.orjson
+        try:
+            for label, module in (("default", saved), ("stdlib", None)):
+                pbhp_core.orjson = module
+                engine.export_logs(tmppath)
+                with open(tmppath, "r", encoding="utf-8") as f:
+                    assert_eq(f"Export layout ({label})", f.read(), expected)
+        finally:
+            pbhp_core.orjson = saved
+
+        engine.export_logs(tmppath, compact=True)
+        with open(tmppath, "r", encoding="utf-8") as f:
+            text = f.read()
+        assert_false("Export compact single line", "\n" in text)
+        assert_eq("Export compact round-trips", json.loads(text), json.loads(expected))
+
+        empty = PBHPEngine()
+        empty.export_logs(tmppath)
+        with open(tmppath, "r", encoding="utf-8") as f:
+            assert_eq("Export empty list", f.read(), "[]")
     finally:
         os.unlink(tmppath)
 
 
+def test_log_compact_json():
+    print("\n--- Log Compact JSON ---")
+
+    import pbhp_core
+
+    engine = PBHPEngine()
+    log = engine.create_assessment("Compact test", "ai_system")
+    engine.finalize_decision(log, DecisionOutcome.PROCEED, "OK")
+
+    j = log.to_json(indent=None)
+    assert_false("Compact JSON single line", "\n" in j)
+    assert_false("Compact JSON no padding", ", " in j or '": ' in j)
+    assert_eq("Compact JSON round-trips", json.loads(j), log.to_dict())
+
+    # Stdlib fallback encodes enums and datetimes the same way as orjson
+    saved = pbhp_core.orjson
+    pbhp_core.orjson = None
+    try:
+        payload = {"risk": RiskClass.RED, "at": datetime(2026, 1, 2, 3, 4, 5)}
+        assert_eq("Fallback compact_json", pbhp_core.compact_json(payload),
+                  '{"risk":"red","at":"2026-01-02T03:04:05"}')
+    finally:
+        pbhp_core.orjson = saved
+
+
+def test_pattern_family_matches_naive_search():
+    print("\n--- Pattern Family Matching ---")
+
+    import re
+    import pbhp_core
+
+    texts = [
+        "we will send the report on friday after review",
+        "they're all vermin and you are the chosen one, genius level",
+        "it's temporary, just following orders, tier 1 insight",
+        "what an idiot, they don't matter",
+    ]
+    families = [
+        tuple(p for p, _ in DriftAlarmDetector.DRIFT_PATTERNS),
+        tuple(p for p, _ in DriftAlarmDetector.COMPASSION_DRIFT_PATTERNS),
+        tuple(p for p, _ in DriftAlarmDetector.SYCOPHANCY_PATTERNS),
+        tuple(ToneValidator.CONTEMPT_PATTERNS),
+    ]
+    mismatches = [
+        (fam[0], t) for fam in families for t in texts
+        if pbhp_core._family_matches(fam, t)
+        != [i for i, p in enumerate(fam) if re.search(p, t)]
+    ]
+    assert_eq("Family matches equal per-pattern search", mismatches, [])
+
+
+def test_mentions_safer_alternative():
+    print("\n--- Safer Alternative Mention ---")
+
+    assert_true("Safer alt exact", mentions_safer_alternative("No safer alternative fits"))
+    assert_true("Safer alt mixed case", mentions_safer_alternative("Each Safer Alternatives option failed"))
+    assert_false("Safer alt absent", mentions_safer_alternative("We considered other options"))
+    assert_false("Safer alt empty", mentions_safer_alternative(""))
+
+
 def test_log_get_by_id():
     print("\n--- Log Get By ID ---")
 
@@ -2685,6 +2860,53 @@ def test_risk_class_priority():
     assert_true("RED < BLACK", PBHPEngine._risk_class_priority(RiskClass.RED) < PBHPEngine._risk_class_priority(RiskClass.BLACK))
 
 
+def test_base_risk_table_matches_rules():
+    print("\n--- Base Risk Table ---")
+
+    import pbhp_core
+
+    table = pbhp_core._BASE_RISK_TABLE
+    assert_len("Risk table covers all combinations", table, 64)
+    mismatches = [
+        key for key, risk in table.items()
+        if pbhp_core._classify_base_risk(*key) != risk
+    ]
+    assert_eq("Risk table matches rules", mismatches, [])
+
+    # Non-bool flags fall back to the rule function
+    h = Harm("x", ImpactLevel.SEVERE, LikelihoodLevel.LIKELY, "yes", False, [], "")
+    assert_eq("Truthy flag fallback", h.calculate_risk_class(), RiskClass.RED)
+
+
+def test_harm_risk_class_cached():
+    print("\n--- Harm Risk Class Cache ---")
+
+    h = Harm("x", ImpactLevel.MODERATE, LikelihoodLevel.POSSIBLE, False, False, [], "")
+    assert_eq("Cached risk first call", h.calculate_risk_class(), RiskClass.YELLOW)
+    assert_eq("Cached risk repeat call", h.calculate_risk_class(), RiskClass.YELLOW)
+
+    # Editing an input invalidates the cached value
+    h.audience_risk_elevated = True
+    assert_eq("Cache follows audience elevation", h.calculate_risk_class(), RiskClass.ORANGE)
+    h.impact = ImpactLevel.TRIVIAL
+    assert_eq("Cache follows impact edit", h.calculate_risk_class(), RiskClass.YELLOW)
+
+    # The cache is not part of equality or repr
+    h2 = Harm("x", ImpactLevel.TRIVIAL, LikelihoodLevel.POSSIBLE, False, False, [], "",
+              audience_risk_elevated=True)
+    assert_true("Cache ignored by equality", h == h2)
+    assert_false("Cache hidden from repr", "_risk_cache" in repr(h))
+
+
+def test_record_dataclasses_use_slots():
+    print("\n--- Record Dataclass Slots ---")
+
+    for cls in (Harm, EpistemicFence, RedTeamReview, UncertaintyAssessment):
+        assert_true(cls.__name__ + " defines __slots__", "__slots__" in cls.__dict__)
+    h = Harm("x", ImpactLevel.MODERATE, LikelihoodLevel.POSSIBLE, False, False, [], "")
+    assert_false("Harm has no per-instance dict", hasattr(h, "__dict__"))
+
+
 # ===================================================================
 # SECTION 33: Missing Door/Wall/Gap Validation
 # ===================================================================
@@ -3148,6 +3370,7 @@ def run_all_tests():
     test_engine_constraint_awareness_check()
     test_engine_absolute_rejection()
     test_engine_add_harm()
+    test_engine_add_harms()
     test_engine_consent_check()
     test_engine_alternatives()
     test_engine_red_team_review()
@@ -3170,6 +3393,9 @@ def run_all_tests():
     # Serialization
     test_log_serialization()
     test_log_export()
+    test_log_compact_json()
+    test_mentions_safer_alternative()
+    test_pattern_family_matches_naive_search()
     test_log_get_by_id()
     test_log_overall_confidence()
 
@@ -3198,6 +3424,9 @@ def run_all_tests():
     test_validate_consent_dignity()
     test_harm_to_dict_includes_calculated_risk()
     test_risk_class_priority()
+    test_base_risk_table_matches_rules()
+    test_harm_risk_class_cached()
+    test_record_dataclasses_use_slots()
     test_missing_dwg_validation()
 
     # v0.7.1: Text normalization